@@ -1,6 +1,13 @@
 import asyncio
-import json
+import contextlib
+import copy
+import functools
+import time
+from collections import OrderedDict
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
+import ahocorasick
+import aiohttp
 from loguru import logger
 from app.core.config import settings
 from app.agents.finance_agent import FinanceAgent
@@ -12,6 +19,193 @@ from app.core.voice_processor import VoiceProcessor
 from app.core.openai_service import openai_service
 # from app.core.language_detector import LanguageDetector
 
+# Keywords that route a query to a specific agent
+_INTENT_KEYWORDS = {
+    "finance": ["loan", "debt", "payment", "money", "credit", "karz", "udhar", "qarz"],
+    "agronomy": ["crop", "seed", "fertilizer", "pest", "soil", "fasal", "beej", "khad"],
+    "market": ["price", "mandi", "sell", "buy", "rate", "bhav", "bikri"],
+    "policy": ["subsidy", "scheme", "government", "yojana", "sarkar"],
+    "risk": ["weather", "rain", "drought", "flood", "mausam", "baarish"]
+}
+
+# Keywords that indicate a query needs multi-agent analysis
+_COMPREHENSIVE_KEYWORDS = [
+    "loan", "crop", "revenue", "repay", "agronomy", "market", "policy", "risk",
+    "karz", "fasal", "kamai", "kisht", "kheti", "mandi", "yojana", "khatra"
+]
+
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    """Build the Aho-Corasick automaton mapping each keyword to its agent
+    bucket and comprehensive flag"""
+    payloads = {}
+    for agent, keywords in _INTENT_KEYWORDS.items():
+        for keyword in keywords:
+            payloads[keyword] = (agent, False)
+    for keyword in _COMPREHENSIVE_KEYWORDS:
+        agent, _ = payloads.get(keyword, (None, False))
+        payloads[keyword] = (agent, True)
+
+    automaton = ahocorasick.Automaton()
+    for keyword, payload in payloads.items():
+        automaton.add_word(keyword, payload)
+    automaton.make_automaton()
+    return automaton
+
+# Compiled once per process and shared by every orchestrator instance
+_KW_AUTOMATON = _build_keyword_automaton()
+
+# Agent dispatch order - keeps primary_intent deterministic
+_AGENT_ORDER = ("finance", "agronomy", "market", "policy", "risk")
+
+@functools.lru_cache(maxsize=4096)
+def _classify_intent_sync(query_lower: str) -> tuple:
+    """Pure classification core: one automaton scan over the lowercased
+    query. Cached because common farmer queries recur constantly - a hit
+    skips the scan entirely."""
+    matched_agents = set()
+    comprehensive = False
+
+    for _, (agent, is_comprehensive) in _KW_AUTOMATON.iter(query_lower):
+        if agent:
+            matched_agents.add(agent)
+        comprehensive |= is_comprehensive
+
+    involved = tuple(agent for agent in _AGENT_ORDER if agent in matched_agents)
+    if not involved:
+        # No specific intent detected - involve the core trio
+        involved = ("finance", "agronomy", "market")
+
+    return involved, 0.8, involved[0], comprehensive
+
+# Shared immutable mock context - no per-call allocation. Replaced by the
+# pooled DB fetch in _get_user_context once real user data lands.
+_MOCK_USER_CONTEXT = MappingProxyType({
+    "location": "Punjab",
+    "current_loans": [
+        {"amount": 50000, "interest_rate": 7.5, "remaining": 35000}
+    ],
+    "current_crops": [
+        {"name": "wheat", "area": 5.0, "stage": "growing"}
+    ],
+    "soil_health": {"ph": 7.2, "nitrogen": "medium"},
+    "language": "hi"
+})
+
+# Queries made up entirely of these tokens are trivial greetings and get a
+# canned localized reply without touching any agent or LLM
+_GREETING_TOKENS = frozenset({
+    "hi", "hii", "hello", "hey", "namaste", "namaskar", "salaam", "sat",
+    "sri", "akal", "good", "morning", "afternoon", "evening",
+    "kya", "haal", "hai", "kaise", "ho", "जी", "नमस्ते", "नमस्कार"
+})
+
+# Static per-language responses, built once at import time. Read-only so the
+# error/default paths can hand out references without allocating.
+_ERROR_RESPONSES = MappingProxyType({
+    "hi": {
+        "text": "माफ़ करें, अभी कुछ तकनीकी समस्या है। कृपया कुछ देर बाद फिर से कोशिश करें।",
+        "voice_ready": ["माफ़ करें, अभी कुछ तकनीकी समस्या है।", "कृपया कुछ देर बाद फिर से कोशिश करें।"],
+        "language": "hi",
+        "intent": "error",
+        "confidence": 0.0,
+        "suggestions": []
+    },
+    "en": {
+        "text": "Sorry, there's a technical issue right now. Please try again later.",
+        "voice_ready": ["Sorry, there's a technical issue right now.", "Please try again later."],
+        "language": "en",
+        "intent": "error",
+        "confidence": 0.0,
+        "suggestions": []
+    }
+})
+
+_DEFAULT_RESPONSES = MappingProxyType({
+    "hi": "नमस्कार! मैं आपकी कृषि और वित्तीय सलाह के लिए यहाँ हूँ। कृपया अपना सवाल पूछें।",
+    "en": "Hello! I'm here to help with your agriculture and financial advice. Please ask your question.",
+    "bn": "নমস্কার! আমি আপনার কৃষি এবং আর্থিক পরামর্শের জন্য এখানে আছি। অনুগ্রহ করে আপনার প্রশ্ন জিজ্ঞাসা করুন।",
+    "ta": "வணக்கம்! நான் உங்கள் விவசாயம் மற்றும் நிதி ஆலோசனைக்காக இங்கே இருக்கிறேன். தயவுசெய்து உங்கள் கேள்வியைக் கேள்வி."
+})
+
+# Prompt for LLM-backed synthesis, built once. When real synthesis is wired
+# in this should go through a streaming chat call so the first tokens reach
+# the voice layer immediately.
+_SYNTH_TEMPLATE = """
+Combine the following agent responses into a coherent, helpful response in {language}:
+
+{responses}
+
+Make sure the response is:
+1. Culturally appropriate for Indian farmers
+2. Clear and actionable
+3. Prioritizes the most important information first
+4. Uses simple, understandable language
+"""
+
+# Follow-up suggestion per (agent, language) - adding a language is a data
+# change here instead of a new ternary in code
+_SUGGESTIONS = MappingProxyType({
+    ("finance", "hi"): "अपने कर्ज का विस्तृत विश्लेषण देखें",
+    ("finance", "en"): "View detailed loan analysis",
+    ("agronomy", "hi"): "फसल की देखभाल के टिप्स जानें",
+    ("agronomy", "en"): "Get crop care tips",
+    ("market", "hi"): "मंडी के भाव और बिक्री की सलाह लें",
+    ("market", "en"): "Get market prices and selling advice",
+    ("policy", "hi"): "सरकारी योजनाओं की जानकारी लें",
+    ("policy", "en"): "Get government scheme information",
+    ("risk", "hi"): "जोखिम प्रबंधन की रणनीतियां जानें",
+    ("risk", "en"): "Learn risk management strategies"
+})
+
+# Per-agent section headers used when combining multi-agent responses,
+# in the order sections should appear
+_AGENT_HEADERS = (
+    ("finance", "💰 वित्तीय सलाह"),
+    ("agronomy", "🌱 कृषि सलाह"),
+    ("market", "📊 बाजार की जानकारी"),
+    ("policy", "🏛️ सरकारी योजनाएं"),
+    ("risk", "⚠️ जोखिम चेतावनी")
+)
+
+# Farmer queries repeat heavily ("wheat price in mandi", "PM Kisan yojana"),
+# so short-circuit repeats with a small two-tier LRU cache:
+# Tier 0 matches the whitespace-normalized query exactly, Tier 1 matches the
+# same tokens in any order. Entries expire after a short TTL so price and
+# weather data never goes stale.
+_CACHE_MAX_ENTRIES = 50
+_CACHE_TTL_SECONDS = 60.0
+_exact_cache: OrderedDict = OrderedDict()
+_fuzzy_cache: OrderedDict = OrderedDict()
+
+def _response_cache_keys(normalized_query: str, user_id: str, language: str) -> tuple:
+    """Build the (exact, fuzzy) cache keys for an already-normalized query"""
+    exact_key = f"{language}|{user_id}|{normalized_query}"
+    fuzzy_key = f"{language}|{user_id}|{' '.join(sorted(normalized_query.split()))}"
+    return exact_key, fuzzy_key
+
+def _response_cache_get(exact_key: str, fuzzy_key: str) -> Optional[Dict[str, Any]]:
+    """Return a cached response, or None on miss/expiry"""
+    now = time.monotonic()
+    for cache, key in ((_exact_cache, exact_key), (_fuzzy_cache, fuzzy_key)):
+        entry = cache.get(key)
+        if entry is None:
+            continue
+        cached_at, response = entry
+        if now - cached_at < _CACHE_TTL_SECONDS:
+            cache.move_to_end(key)
+            return copy.deepcopy(response)
+        del cache[key]
+    return None
+
+def _response_cache_put(exact_key: str, fuzzy_key: str, response: Dict[str, Any]):
+    """Store a response in both cache tiers with LRU eviction"""
+    entry = (time.monotonic(), copy.deepcopy(response))
+    for cache, key in ((_exact_cache, exact_key), (_fuzzy_cache, fuzzy_key)):
+        cache[key] = entry
+        cache.move_to_end(key)
+        while len(cache) > _CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+
 class AgentOrchestrator:
     """
     Main orchestrator that coordinates all specialized AI agents
@@ -35,12 +229,29 @@ class AgentOrchestrator:
             "policy": self.policy_agent,
             "risk": self.risk_agent
         }
-        
-        logger.info("🤖 Agent Orchestrator initialized")
-    
+
+        # Bounds how many specialized agents run at once per request
+        self._agent_semaphore = asyncio.Semaphore(5)
+
+        # Conversation-log queue, created in initialize() and drained in
+        # batches by a background task
+        self._log_queue: Optional[asyncio.Queue] = None
+        self._log_task: Optional[asyncio.Task] = None
+        self._dropped_logs = 0
+
+        # One HTTP session per event loop so external API calls (weather,
+        # mandi prices) reuse keep-alive connections instead of paying a
+        # TCP/TLS handshake per request
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+        if settings.DEBUG:
+            logger.info("🤖 Agent Orchestrator initialized")
+
     async def initialize(self):
         """Initialize all agents and load necessary data"""
         try:
+            self._log_queue = asyncio.Queue(maxsize=10000)
+            self._log_task = asyncio.create_task(self._drain_logs())
             await asyncio.gather(
                 self.finance_agent.initialize(),
                 self.agronomy_agent.initialize(),
@@ -53,24 +264,74 @@ class AgentOrchestrator:
             logger.error(f"❌ Error initializing agents: {e}")
             raise
     
-    async def process_query(self, query: str, user_id: str, language: str = "hi") -> Dict[str, Any]:
+    async def process_query(self, query: str, user_id: str, language: str = "hi",
+                            debug: bool = False) -> Dict[str, Any]:
         """
         Process a farmer's query through specialized agents for comprehensive advice
         with voice-first approach and return a structured response.
+
+        Raw agent outputs and user context are only included in the response
+        metadata when debug is True - they can be tens of KB per response.
         """
         try:
-            # Get user context
-            user_context = await self._get_user_context(user_id)
-            
-            # Analyze intent to determine which agents to involve
-            intent_analysis = await self._analyze_intent(query, language)
-            
+            # Lowercase and normalize whitespace exactly once - the cache
+            # keys and the keyword scan all reuse this
+            normalized_query = " ".join(query.lower().split())
+
+            # Tier 0: serve repeated queries straight from the response cache
+            exact_key, fuzzy_key = _response_cache_keys(normalized_query, user_id, language)
+            cached_response = _response_cache_get(exact_key, fuzzy_key)
+            if cached_response is not None:
+                return cached_response
+
+            # Tier 1: trivial greetings get a canned localized reply with
+            # zero agent or LLM work
+            query_tokens = frozenset(normalized_query.split())
+            if query_tokens and query_tokens <= _GREETING_TOKENS:
+                greeting = self._get_default_response(language)
+                return {
+                    "text": greeting,
+                    "intent": "greeting",
+                    "confidence": 1.0,
+                    "agents_used": [],
+                    "voice_ready": [greeting],
+                    "suggestions": [],
+                    "metadata": {"tier": 1}
+                }
+
+            # Speculatively start the user-context fetch so the DB round-trip
+            # overlaps with intent classification; cancelled if the simple
+            # path wins and never needs it
+            context_task = asyncio.create_task(self._get_user_context(user_id))
+
+            intent_analysis = self._classify(normalized_query)
+
             # Check if this is a comprehensive query that needs multiple agents
-            if self._is_comprehensive_query(query):
+            if intent_analysis["is_comprehensive"]:
+                user_context = await context_task
+
                 # Use specialized agents for detailed analysis
                 agent_responses = await self._process_with_agents(query, intent_analysis, user_context, language)
-                synthesized_response = await self._synthesize_response(agent_responses, language)
-                
+
+                if len(agent_responses) == 1:
+                    # Tier 2: a single agent answers directly - no synthesis
+                    synthesized_response = next(iter(agent_responses.values()))
+                    tier = 2
+                else:
+                    # Tier 4: full multi-agent synthesis
+                    synthesized_response = await self._synthesize_response(agent_responses, language)
+                    tier = 4
+
+                metadata: Dict[str, Any] = {"tier": tier}
+                if debug:
+                    # Redacted context subset - loan amounts and soil data
+                    # never leave the service
+                    metadata["user_context"] = {
+                        "location": user_context.get("location"),
+                        "language": user_context.get("language")
+                    }
+                    metadata["agent_responses"] = agent_responses
+
                 # Create structured response
                 response = {
                     "text": synthesized_response,
@@ -79,18 +340,25 @@ class AgentOrchestrator:
                     "agents_used": intent_analysis["involved_agents"],
                     "voice_ready": [synthesized_response],
                     "suggestions": self._generate_suggestions(intent_analysis["involved_agents"], language),
-                    "metadata": {
-                        "user_context": user_context,
-                        "agent_responses": agent_responses
-                    }
+                    "metadata": metadata
                 }
             else:
-                # Use OpenAI for simple queries
+                # Simple path never reads the context - don't pay for the fetch
+                context_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await context_task
+
+                # Tier 3: use OpenAI for simple queries
                 response = await openai_service.get_krishi_mitra_response(query, user_id, language)
+                response.setdefault("metadata", {})["tier"] = 3
             
-            # Log conversation
-            await self._log_conversation(user_id, query, response["text"], language, response["intent"])
-            
+            # Cache the successful response for repeated queries
+            _response_cache_put(exact_key, fuzzy_key, response)
+
+            # Queue the conversation log - the response never waits on the
+            # analytics write
+            self._log_conversation(user_id, query, response["text"], language, response["intent"])
+
             return response
             
         except Exception as e:
@@ -99,64 +367,85 @@ class AgentOrchestrator:
     
     async def _analyze_intent(self, query: str, language: str) -> Dict[str, Any]:
         """Analyze the intent of the query to determine which agents to involve"""
-        intent_keywords = {
-            "finance": ["loan", "debt", "payment", "money", "credit", "karz", "udhar", "qarz"],
-            "agronomy": ["crop", "seed", "fertilizer", "pest", "soil", "fasal", "beej", "khad"],
-            "market": ["price", "mandi", "sell", "buy", "rate", "bhav", "bikri"],
-            "policy": ["subsidy", "scheme", "government", "yojana", "sarkar"],
-            "risk": ["weather", "rain", "drought", "flood", "mausam", "baarish"]
-        }
-        
-        query_lower = query.lower()
-        involved_agents = []
-        
-        for agent, keywords in intent_keywords.items():
-            if any(keyword in query_lower for keyword in keywords):
-                involved_agents.append(agent)
-        
-        # If no specific intent detected, involve all agents for comprehensive advice
-        if not involved_agents:
-            involved_agents = ["finance", "agronomy", "market"]
-        
+        return self._classify(query.lower())
+
+    def _classify(self, query_lower: str) -> Dict[str, Any]:
+        """Classify an already-lowercased query - determines both the
+        involved agents and whether the query needs multi-agent analysis"""
+        involved, confidence, primary, comprehensive = _classify_intent_sync(query_lower)
         return {
-            "involved_agents": involved_agents,
-            "confidence": 0.8,
-            "primary_intent": involved_agents[0] if involved_agents else "general"
+            "involved_agents": list(involved),
+            "confidence": confidence,
+            "primary_intent": primary,
+            "is_comprehensive": comprehensive
         }
     
+    async def process_query_batch(self, items: List[tuple], max_concurrency: int = 16) -> List[Any]:
+        """
+        Process a batch of (query, user_id, language) tuples concurrently
+        with bounded concurrency. Failures come back as exceptions in the
+        result list instead of failing the whole batch.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run(query: str, user_id: str, language: str = "hi"):
+            async with semaphore:
+                return await self.process_query(query, user_id, language)
+
+        return await asyncio.gather(*(_run(*item) for item in items), return_exceptions=True)
+
+    async def get_debt_forecast_batch(self, user_ids: List[str], max_concurrency: int = 16) -> List[Any]:
+        """Get debt forecasts for many users concurrently"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run(user_id: str):
+            async with semaphore:
+                return await self.get_debt_forecast(user_id)
+
+        return await asyncio.gather(*(_run(uid) for uid in user_ids), return_exceptions=True)
+
+    async def get_market_insights_batch(self, crops: List[tuple], max_concurrency: int = 16) -> List[Any]:
+        """Get market insights for many (crop_name, location) pairs concurrently"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run(crop_name: str, location: str):
+            async with semaphore:
+                return await self.get_market_insights(crop_name, location)
+
+        return await asyncio.gather(*(_run(*item) for item in crops), return_exceptions=True)
+
     async def _get_user_context(self, user_id: str) -> Dict[str, Any]:
-        """Get user's current context including loans, crops, location, etc."""
-        # This would typically fetch from database
-        # For now, return mock data
-        return {
-            "user_id": user_id,
-            "location": "Punjab",
-            "current_loans": [
-                {"amount": 50000, "interest_rate": 7.5, "remaining": 35000}
-            ],
-            "current_crops": [
-                {"name": "wheat", "area": 5.0, "stage": "growing"}
-            ],
-            "soil_health": {"ph": 7.2, "nitrogen": "medium"},
-            "language": "hi"
-        }
+        """Get user's current context including loans, crops, location, etc.
+
+        Returns the shared mock for now. The DB-backed version should be a
+        one-liner here: acquire a connection from the asyncpg pool and run a
+        prepared statement created once in initialize(), e.g.
+        `row = await conn.fetchrow(self._ctx_stmt, user_id)`.
+        """
+        return _MOCK_USER_CONTEXT
     
     async def _process_with_agents(self, query: str, intent_analysis: Dict, 
                                  user_context: Dict, language: str) -> Dict[str, str]:
-        """Process query with relevant agents"""
+        """Process query with relevant agents concurrently"""
+        involved_agents = [name for name in intent_analysis["involved_agents"] if name in self.agents]
+
+        async def _run_agent(agent_name: str) -> str:
+            async with self._agent_semaphore:
+                return await self.agents[agent_name].process(query, user_context, language)
+
+        results = await asyncio.gather(
+            *(_run_agent(name) for name in involved_agents),
+            return_exceptions=True
+        )
+
         responses = {}
-        
-        for agent_name in intent_analysis["involved_agents"]:
-            if agent_name in self.agents:
-                try:
-                    agent_response = await self.agents[agent_name].process(
-                        query, user_context, language
-                    )
-                    responses[agent_name] = agent_response
-                except Exception as e:
-                    logger.error(f"❌ Error with {agent_name} agent: {e}")
-                    responses[agent_name] = f"Sorry, {agent_name} agent is temporarily unavailable."
-        
+        for agent_name, result in zip(involved_agents, results):
+            if isinstance(result, Exception):
+                logger.opt(exception=result).error("❌ Error with {} agent", agent_name)
+                responses[agent_name] = f"Sorry, {agent_name} agent is temporarily unavailable."
+            else:
+                responses[agent_name] = result
+
         return responses
     
     async def _synthesize_response(self, responses: Dict[str, str], language: str) -> str:
@@ -165,74 +454,83 @@ class AgentOrchestrator:
             return self._get_default_response(language)
         
         if len(responses) == 1:
-            return list(responses.values())[0]
-        
-        # For multiple agents, create a comprehensive response
-        synthesis_prompt = f"""
-        Combine the following agent responses into a coherent, helpful response in {language}:
-        
-        {json.dumps(responses, indent=2)}
-        
-        Make sure the response is:
-        1. Culturally appropriate for Indian farmers
-        2. Clear and actionable
-        3. Prioritizes the most important information first
-        4. Uses simple, understandable language
-        """
-        
-        # For now, return a simple combination
-        # In production, this would use an LLM to synthesize
-        combined_response = "🌾 आपके सवाल के लिए मेरी सलाह:\n\n"
-        
-        for agent, response in responses.items():
-            agent_names = {
-                "finance": "💰 वित्तीय सलाह",
-                "agronomy": "🌱 कृषि सलाह", 
-                "market": "📊 बाजार की जानकारी",
-                "policy": "🏛️ सरकारी योजनाएं",
-                "risk": "⚠️ जोखिम चेतावनी"
-            }
-            combined_response += f"{agent_names.get(agent, agent)}:\n{response}\n\n"
-        
-        return combined_response
+            return next(iter(responses.values()))
+
+        # For now, return a simple combination. In production, this would
+        # stream an LLM call built from _SYNTH_TEMPLATE and feed tokens to
+        # the voice layer as they arrive.
+        parts = [
+            f"{header}:\n{responses[agent]}"
+            for agent, header in _AGENT_HEADERS
+            if agent in responses
+        ]
+        return "🌾 आपके सवाल के लिए मेरी सलाह:\n\n" + "\n\n".join(parts)
     
-    async def _log_conversation(self, user_id: str, query: str, response: str, 
-                              language: str, intent: str):
-        """Log the conversation for analytics and improvement"""
-        # This would typically save to database
-        logger.info(f"💬 Conversation logged - User: {user_id}, Language: {language}, Intent: {intent}")
+    def _log_conversation(self, user_id: str, query: str, response: str,
+                          language: str, intent: str):
+        """Queue the conversation for the background log writer"""
+        if self._log_queue is None:
+            return
+        try:
+            self._log_queue.put_nowait((user_id, query, response, language, intent))
+        except asyncio.QueueFull:
+            # Dropping a log entry is better than blocking the response
+            self._dropped_logs += 1
+
+    async def _drain_logs(self):
+        """Drain queued conversation logs in batches off the request path"""
+        while True:
+            batch = [await self._log_queue.get()]
+            while len(batch) < 256:
+                try:
+                    batch.append(self._log_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            # This would typically be one batched INSERT to the database.
+            # Lazy formatting so production log levels skip the work entirely
+            for user_id, query, response, language, intent in batch:
+                logger.opt(lazy=True).debug(
+                    "💬 Conversation logged - User: {}, Language: {}, Intent: {}",
+                    lambda u=user_id: u, lambda l=language: l, lambda i=intent: i
+                )
+            for _ in batch:
+                self._log_queue.task_done()
+
+    def _session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session for the current event loop,
+        creating it lazily on first use"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+            )
+            self._sessions[loop] = session
+        return session
+
+    async def shutdown(self):
+        """Flush pending conversation logs and stop the background writer"""
+        if self._log_queue is not None:
+            await self._log_queue.join()
+        if self._log_task is not None:
+            self._log_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._log_task
+        for session in self._sessions.values():
+            if not session.closed:
+                await session.close()
+        self._sessions.clear()
     
     def _get_error_response(self, language: str) -> Dict[str, Any]:
         """Get error response in appropriate language"""
-        error_responses = {
-            "hi": {
-                "text": "माफ़ करें, अभी कुछ तकनीकी समस्या है। कृपया कुछ देर बाद फिर से कोशिश करें।",
-                "voice_ready": ["माफ़ करें, अभी कुछ तकनीकी समस्या है।", "कृपया कुछ देर बाद फिर से कोशिश करें।"],
-                "language": language,
-                "intent": "error",
-                "confidence": 0.0,
-                "suggestions": []
-            },
-            "en": {
-                "text": "Sorry, there's a technical issue right now. Please try again later.",
-                "voice_ready": ["Sorry, there's a technical issue right now.", "Please try again later."],
-                "language": language,
-                "intent": "error",
-                "confidence": 0.0,
-                "suggestions": []
-            }
-        }
-        return error_responses.get(language, error_responses["en"])
-    
+        # Callers return this dict up the stack without mutating it,
+        # so handing out the shared constant is safe
+        return _ERROR_RESPONSES.get(language, _ERROR_RESPONSES["en"])
+
     def _get_default_response(self, language: str) -> str:
         """Get default response when no specific advice is available"""
-        default_responses = {
-            "hi": "नमस्कार! मैं आपकी कृषि और वित्तीय सलाह के लिए यहाँ हूँ। कृपया अपना सवाल पूछें।",
-            "en": "Hello! I'm here to help with your agriculture and financial advice. Please ask your question.",
-            "bn": "নমস্কার! আমি আপনার কৃষি এবং আর্থিক পরামর্শের জন্য এখানে আছি। অনুগ্রহ করে আপনার প্রশ্ন জিজ্ঞাসা করুন।",
-            "ta": "வணக்கம்! நான் உங்கள் விவசாயம் மற்றும் நிதி ஆலோசனைக்காக இங்கே இருக்கிறேன். தயவுசெய்து உங்கள் கேள்வியைக் கேள்வி."
-        }
-        return default_responses.get(language, default_responses["en"])
+        return _DEFAULT_RESPONSES.get(language, _DEFAULT_RESPONSES["en"])
     
     async def get_debt_forecast(self, user_id: str) -> Dict[str, Any]:
         """Get personalized debt freedom forecast for a user"""
@@ -246,33 +544,30 @@ class AgentOrchestrator:
         """Get market insights for a specific crop and location"""
         return await self.market_agent.get_market_insights(crop_name, location)
 
-    def _is_comprehensive_query(self, query: str) -> bool:
-        """Check if query requires multiple agent analysis"""
-        comprehensive_keywords = [
-            "loan", "crop", "revenue", "repay", "agronomy", "market", "policy", "risk",
-            "karz", "fasal", "kamai", "kisht", "kheti", "mandi", "yojana", "khatra"
-        ]
-        query_lower = query.lower()
-        return any(keyword in query_lower for keyword in comprehensive_keywords)
-    
     def _generate_suggestions(self, agents_used: List[str], language: str) -> List[str]:
         """Generate follow-up suggestions based on agents used"""
-        suggestions = []
-        
-        if "finance" in agents_used:
-            suggestions.append("अपने कर्ज का विस्तृत विश्लेषण देखें" if language == "hi" else "View detailed loan analysis")
-        if "agronomy" in agents_used:
-            suggestions.append("फसल की देखभाल के टिप्स जानें" if language == "hi" else "Get crop care tips")
-        if "market" in agents_used:
-            suggestions.append("मंडी के भाव और बिक्री की सलाह लें" if language == "hi" else "Get market prices and selling advice")
-        if "policy" in agents_used:
-            suggestions.append("सरकारी योजनाओं की जानकारी लें" if language == "hi" else "Get government scheme information")
-        if "risk" in agents_used:
-            suggestions.append("जोखिम प्रबंधन की रणनीतियां जानें" if language == "hi" else "Learn risk management strategies")
-        
-        return suggestions
+        return [
+            _SUGGESTIONS.get((agent, language), _SUGGESTIONS[(agent, "en")])
+            for agent in agents_used
+            if (agent, "en") in _SUGGESTIONS
+        ]
+
+# Shared instance, created lazily so importing this module (CLI tools,
+# migrations, tests) doesn't pay for constructing five agents
+_instance: Optional[AgentOrchestrator] = None
+
+def get_agent_orchestrator() -> AgentOrchestrator:
+    """Get the shared AgentOrchestrator, creating it on first access"""
+    global _instance
+    if _instance is None:
+        _instance = AgentOrchestrator()
+        if settings.DEBUG:
+            logger.info("✅ Global AgentOrchestrator instance created")
+    return _instance
 
-# Create a global instance
-logger.info("🤖 Creating global AgentOrchestrator instance...")
-agent_orchestrator = AgentOrchestrator()
-logger.info("✅ Global AgentOrchestrator instance created successfully")
+def __getattr__(name: str) -> Any:
+    # Keep `from app.agents.agent_orchestrator import agent_orchestrator`
+    # working for existing callers (PEP 562)
+    if name == "agent_orchestrator":
+        return get_agent_orchestrator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,359 +1,286 @@
 import asyncio
+import functools
 import json
-from typing import Dict, List, Any, Optional
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Dict, Final, List, Any, Optional
 from datetime import datetime, timedelta
+import ahocorasick
+import numpy as np
 from loguru import logger
 from app.core.config import settings
 
-class AgronomyAgent:
-    """
-    Agronomy Agent - Handles crop recommendations, soil health analysis,
-    and farming best practices for Indian farmers.
+# Keyword lists for query-type classification; compiled once into an
+# Aho-Corasick automaton so a query is scanned in a single pass instead of
+# one substring search per keyword.
+_QUERY_KEYWORDS: Final = {
+    "crop_recommendation": ["crop", "fasal", "beej", "plant", "grow"],
+    "soil_health": ["soil", "mitti", "ph", "fertilizer", "khad"],
+    "pest_management": ["pest", "disease", "keet", "rogi"],
+    "farming_practices": ["practice", "technique", "method", "tarika"],
+}
+
+# Mirrors the if/elif order of the old classifier: crop keywords win over
+# soil, soil over pest, pest over practices.
+_QUERY_TYPE_PRIORITY: Final = ("crop_recommendation", "soil_health", "pest_management", "farming_practices")
+
+def _build_query_automaton() -> "ahocorasick.Automaton":
+    automaton = ahocorasick.Automaton()
+    for query_type, words in _QUERY_KEYWORDS.items():
+        for word in words:
+            automaton.add_word(word, query_type)
+    automaton.make_automaton()
+    return automaton
+
+_QUERY_AUTOMATON = _build_query_automaton()
+
+# Month -> agricultural season lookup, index = month - 1
+# (Oct-Jan rabi, Jun-Sep kharif, Feb-May zaid)
+_MONTH_TO_SEASON: Final = ("rabi", "zaid", "zaid", "zaid", "zaid",
+                    "kharif", "kharif", "kharif", "kharif",
+                    "rabi", "rabi", "rabi")
+
+@functools.lru_cache(maxsize=2)
+def _season_for_hour(hour_bucket: int) -> str:
+    """Season for one wall-clock hour.
+
+    The season changes at most once a month, so caching per hour keeps the
+    datetime.now() call off the per-request path while still picking up
+    month rollovers promptly.
     """
-    
-    def __init__(self):
-        self.name = "Agronomy Agent"
-        self.description = "Specialized in crop science, soil health, and farming techniques"
-        self.initialized = False
-        
-    async def initialize(self):
-        """Initialize the agronomy agent with crop and soil data"""
-        try:
-            await self._load_agronomy_data()
-            self.initialized = True
-            logger.info("🌱 Agronomy Agent initialized successfully")
-        except Exception as e:
-            logger.error(f"❌ Error initializing Agronomy Agent: {e}")
-            raise
-    
-    async def _load_agronomy_data(self):
-        """Load crop, soil, and farming data"""
-        # Comprehensive crop data for Punjab
-        self.crops = {
-            "wheat": {
-                "season": "rabi",
-                "duration": 120,
-                "water_requirement": "medium",
-                "soil_type": "loamy",
-                "ph_range": (6.0, 7.5),
-                "yield_per_acre": 20,  # quintals
-                "market_price": 2100,  # per quintal
-                "input_cost": 15000,  # per acre
-                "profit_margin": 0.4,
-                "sowing_time": "November-December",
-                "harvest_time": "March-April",
-                "best_varieties": ["PBW-343", "HD-2967", "WH-1105"],
-                "fertilizer_requirement": {"N": 120, "P": 60, "K": 40},  # kg/acre
-                "pest_management": ["Aphids", "Termites", "Rust"],
-                "disease_resistance": "Moderate",
-                "climate_suitability": "Cool and dry"
-            },
-            "rice": {
-                "season": "kharif",
-                "duration": 150,
-                "water_requirement": "high",
-                "soil_type": "clay",
-                "ph_range": (5.5, 6.5),
-                "yield_per_acre": 25,
-                "market_price": 1800,
-                "input_cost": 18000,
-                "profit_margin": 0.35,
-                "sowing_time": "June-July",
-                "harvest_time": "October-November",
-                "best_varieties": ["PR-114", "PR-116", "PR-118"],
-                "fertilizer_requirement": {"N": 150, "P": 75, "K": 50},
-                "pest_management": ["Stem borer", "Leaf folder", "Bacterial blight"],
-                "disease_resistance": "High",
-                "climate_suitability": "Warm and humid"
-            },
-            "maize": {
-                "season": "kharif",
-                "duration": 100,
-                "water_requirement": "medium",
-                "soil_type": "loamy",
-                "ph_range": (6.0, 7.0),
-                "yield_per_acre": 30,
-                "market_price": 1600,
-                "input_cost": 12000,
-                "profit_margin": 0.5,
-                "sowing_time": "June-July",
-                "harvest_time": "September-October",
-                "best_varieties": ["PMH-1", "PMH-2", "PMH-3"],
-                "fertilizer_requirement": {"N": 100, "P": 50, "K": 30},
-                "pest_management": ["Fall armyworm", "Stem borer", "Ear rot"],
-                "disease_resistance": "Moderate",
-                "climate_suitability": "Warm and moderate rainfall"
-            },
-            "cotton": {
-                "season": "kharif",
-                "duration": 180,
-                "water_requirement": "medium",
-                "soil_type": "sandy_loam",
-                "ph_range": (6.5, 8.0),
-                "yield_per_acre": 8,  # quintals
-                "market_price": 6500,
-                "input_cost": 25000,
-                "profit_margin": 0.45,
-                "sowing_time": "April-May",
-                "harvest_time": "October-December",
-                "best_varieties": ["F-1861", "RCH-134", "F-2228"],
-                "fertilizer_requirement": {"N": 80, "P": 40, "K": 25},
-                "pest_management": ["Bollworm", "Whitefly", "Jassids"],
-                "disease_resistance": "Low",
-                "climate_suitability": "Hot and dry"
-            },
-            "sugarcane": {
-                "season": "year_round",
-                "duration": 365,
-                "water_requirement": "high",
-                "soil_type": "clay_loam",
-                "ph_range": (6.0, 7.5),
-                "yield_per_acre": 350,  # quintals
-                "market_price": 315,  # per quintal
-                "input_cost": 45000,
-                "profit_margin": 0.3,
-                "sowing_time": "February-March",
-                "harvest_time": "November-March",
-                "best_varieties": ["Co-0238", "Co-0118", "Co-0239"],
-                "fertilizer_requirement": {"N": 200, "P": 100, "K": 60},
-                "pest_management": ["Top borer", "Stem borer", "Scale insects"],
-                "disease_resistance": "High",
-                "climate_suitability": "Tropical and subtropical"
-            },
-            "potato": {
-                "season": "rabi",
-                "duration": 90,
-                "water_requirement": "medium",
-                "soil_type": "sandy_loam",
-                "ph_range": (5.5, 6.5),
-                "yield_per_acre": 120,  # quintals
-                "market_price": 800,
-                "input_cost": 35000,
-                "profit_margin": 0.55,
-                "sowing_time": "October-November",
-                "harvest_time": "January-February",
-                "best_varieties": ["Kufri Pukhraj", "Kufri Jyoti", "Kufri Bahar"],
-                "fertilizer_requirement": {"N": 150, "P": 75, "K": 50},
-                "pest_management": ["Aphids", "Cutworms", "Late blight"],
-                "disease_resistance": "Moderate",
-                "climate_suitability": "Cool and moderate"
-            }
-        }
-        
-        # Agronomy techniques and best practices
-        self.agronomy_techniques = {
-            "soil_health": {
-                "soil_testing": "Every 2-3 years for nutrient analysis",
-                "organic_matter": "Maintain 2-3% organic matter",
-                "crop_rotation": "Wheat-Rice-Maize rotation",
-                "green_manuring": "Sesbania or Dhaincha between crops",
-                "mulching": "Straw mulch for moisture retention"
-            },
-            "water_management": {
-                "drip_irrigation": "40-60% water saving",
-                "laser_land_leveling": "Improves water use efficiency by 25%",
-                "alternate_wetting_drying": "For rice cultivation",
-                "sprinkler_irrigation": "For wheat and maize",
-                "water_scheduling": "Based on crop growth stages"
-            },
-            "nutrient_management": {
-                "integrated_nutrient_management": "Combine organic and inorganic",
-                "site_specific_nutrient_management": "Based on soil testing",
-                "foliar_spray": "Micronutrients during critical stages",
-                "bio_fertilizers": "Rhizobium, Azotobacter, PSB",
-                "precision_farming": "GPS-guided fertilizer application"
-            },
-            "pest_management": {
-                "integrated_pest_management": "Cultural, biological, chemical",
-                "pheromone_traps": "For monitoring pest populations",
-                "biological_control": "Trichogramma, neem-based products",
-                "resistant_varieties": "Use disease-resistant crop varieties",
-                "crop_diversification": "Reduce pest pressure"
-            },
-            "precision_agriculture": {
-                "gps_guidance": "Accurate field operations",
-                "variable_rate_technology": "Site-specific input application",
-                "remote_sensing": "Crop health monitoring",
-                "yield_mapping": "Harvest yield data collection",
-                "automated_irrigation": "Sensor-based water management"
-            }
-        }
-        
-        # Punjab-specific soil and climate data
-        self.punjab_data = {
-            "soil_types": {
-                "alluvial": "Most common, good for all crops",
-                "sandy_loam": "Good for vegetables and pulses",
-                "clay_loam": "Ideal for rice and sugarcane",
-                "loamy": "Best for wheat and maize"
-            },
-            "climate_zones": {
-                "sub_mountainous": "Hoshiarpur, Ropar - Good for horticulture",
-                "central_plains": "Ludhiana, Jalandhar - Wheat-rice belt",
-                "south_western": "Bathinda, Mansa - Cotton and oilseeds",
-                "malwa_region": "Patiala, Sangrur - Diversified farming"
-            },
-            "rainfall_pattern": {
-                "annual_rainfall": "600-800 mm",
-                "monsoon_season": "July-September",
-                "winter_rainfall": "December-February",
-                "irrigation_dependency": "80% of crops"
-            }
-        }
-    
-    async def process(self, query: str, user_context: Dict, language: str = "hi") -> str:
-        """Process agronomy-related queries"""
-        try:
-            # Analyze query type
-            query_type = self._analyze_agronomy_query(query)
-            
-            if query_type == "crop_recommendation":
-                return await self._handle_crop_recommendation(user_context, language)
-            elif query_type == "soil_health":
-                return await self._handle_soil_health(user_context, language)
-            elif query_type == "farming_practices":
-                return await self._handle_farming_practices(query, user_context, language)
-            elif query_type == "pest_management":
-                return await self._handle_pest_management(user_context, language)
-            else:
-                return await self._handle_general_agronomy_query(query, user_context, language)
-                
-        except Exception as e:
-            logger.error(f"❌ Error in Agronomy Agent: {e}")
-            return self._get_error_response(language)
-    
-    def _analyze_agronomy_query(self, query: str) -> str:
-        """Analyze the type of agronomy query"""
-        query_lower = query.lower()
-        
-        if any(word in query_lower for word in ["crop", "fasal", "beej", "plant", "grow"]):
-            return "crop_recommendation"
-        elif any(word in query_lower for word in ["soil", "mitti", "ph", "fertilizer", "khad"]):
-            return "soil_health"
-        elif any(word in query_lower for word in ["pest", "disease", "keet", "rogi"]):
-            return "pest_management"
-        elif any(word in query_lower for word in ["practice", "technique", "method", "tarika"]):
-            return "farming_practices"
-        else:
-            return "general"
-    
-    async def _handle_crop_recommendation(self, user_context: Dict, language: str) -> str:
-        """Handle crop recommendation queries"""
-        soil_health = user_context.get("soil_health", {})
-        land_area = user_context.get("land_area", 0)
-        current_season = self._get_current_season()
-        
-        # Get suitable crops based on soil and season
-        suitable_crops = self._get_suitable_crops(soil_health, current_season)
-        
-        # Calculate profitability
-        profitable_crops = []
-        for crop_name in suitable_crops:
-            crop_data = self.crops.get(crop_name, {})
-            if crop_data:
-                profit_per_acre = (crop_data.get("yield_per_acre", 0) * 
-                                 crop_data.get("market_price", 0) * 
-                                 crop_data.get("profit_margin", 0))
-                profitable_crops.append({
-                    "name": crop_name,
-                    "profit_per_acre": profit_per_acre,
-                    "data": crop_data
-                })
-        
-        # Sort by profitability
-        profitable_crops.sort(key=lambda x: x["profit_per_acre"], reverse=True)
-        
-        if language == "hi":
-            response = f"""🌱 आपके लिए फसल सिफारिशें ({current_season} मौसम):
-
-📊 मिट्टी: {soil_health.get('type', 'Unknown')}
-📏 जमीन: {land_area} एकड़
-
-🏆 सर्वश्रेष्ठ फसलें:"""
-            
-            for i, crop in enumerate(profitable_crops[:3], 1):
-                crop_data = crop["data"]
-                response += f"""
-{i}. {crop['name'].title()}
-   💰 लाभ: ₹{crop['profit_per_acre']:,}/एकड़
-   📅 अवधि: {crop_data.get('duration', 0)} दिन
-   💧 पानी: {crop_data.get('water_requirement', 'Unknown')}
-   🌾 उपज: {crop_data.get('yield_per_acre', 0)} क्विंटल/एकड़"""
-            
-            response += f"""
+    return _MONTH_TO_SEASON[datetime.now().month - 1]
+
+# Static agronomy datasets. Built once per process at import; every
+# AgronomyAgent instance shares them instead of re-allocating the
+# literals in _load_agronomy_data.
+_CROPS_RAW: Final = {
+    "wheat": {
+        "season": "rabi",
+        "duration": 120,
+        "water_requirement": "medium",
+        "soil_type": "loamy",
+        "ph_range": (6.0, 7.5),
+        "yield_per_acre": 20,  # quintals
+        "market_price": 2100,  # per quintal
+        "input_cost": 15000,  # per acre
+        "profit_margin": 0.4,
+        "sowing_time": "November-December",
+        "harvest_time": "March-April",
+        "best_varieties": ["PBW-343", "HD-2967", "WH-1105"],
+        "fertilizer_requirement": {"N": 120, "P": 60, "K": 40},  # kg/acre
+        "pest_management": ["Aphids", "Termites", "Rust"],
+        "disease_resistance": "Moderate",
+        "climate_suitability": "Cool and dry"
+    },
+    "rice": {
+        "season": "kharif",
+        "duration": 150,
+        "water_requirement": "high",
+        "soil_type": "clay",
+        "ph_range": (5.5, 6.5),
+        "yield_per_acre": 25,
+        "market_price": 1800,
+        "input_cost": 18000,
+        "profit_margin": 0.35,
+        "sowing_time": "June-July",
+        "harvest_time": "October-November",
+        "best_varieties": ["PR-114", "PR-116", "PR-118"],
+        "fertilizer_requirement": {"N": 150, "P": 75, "K": 50},
+        "pest_management": ["Stem borer", "Leaf folder", "Bacterial blight"],
+        "disease_resistance": "High",
+        "climate_suitability": "Warm and humid"
+    },
+    "maize": {
+        "season": "kharif",
+        "duration": 100,
+        "water_requirement": "medium",
+        "soil_type": "loamy",
+        "ph_range": (6.0, 7.0),
+        "yield_per_acre": 30,
+        "market_price": 1600,
+        "input_cost": 12000,
+        "profit_margin": 0.5,
+        "sowing_time": "June-July",
+        "harvest_time": "September-October",
+        "best_varieties": ["PMH-1", "PMH-2", "PMH-3"],
+        "fertilizer_requirement": {"N": 100, "P": 50, "K": 30},
+        "pest_management": ["Fall armyworm", "Stem borer", "Ear rot"],
+        "disease_resistance": "Moderate",
+        "climate_suitability": "Warm and moderate rainfall"
+    },
+    "cotton": {
+        "season": "kharif",
+        "duration": 180,
+        "water_requirement": "medium",
+        "soil_type": "sandy_loam",
+        "ph_range": (6.5, 8.0),
+        "yield_per_acre": 8,  # quintals
+        "market_price": 6500,
+        "input_cost": 25000,
+        "profit_margin": 0.45,
+        "sowing_time": "April-May",
+        "harvest_time": "October-December",
+        "best_varieties": ["F-1861", "RCH-134", "F-2228"],
+        "fertilizer_requirement": {"N": 80, "P": 40, "K": 25},
+        "pest_management": ["Bollworm", "Whitefly", "Jassids"],
+        "disease_resistance": "Low",
+        "climate_suitability": "Hot and dry"
+    },
+    "sugarcane": {
+        "season": "year_round",
+        "duration": 365,
+        "water_requirement": "high",
+        "soil_type": "clay_loam",
+        "ph_range": (6.0, 7.5),
+        "yield_per_acre": 350,  # quintals
+        "market_price": 315,  # per quintal
+        "input_cost": 45000,
+        "profit_margin": 0.3,
+        "sowing_time": "February-March",
+        "harvest_time": "November-March",
+        "best_varieties": ["Co-0238", "Co-0118", "Co-0239"],
+        "fertilizer_requirement": {"N": 200, "P": 100, "K": 60},
+        "pest_management": ["Top borer", "Stem borer", "Scale insects"],
+        "disease_resistance": "High",
+        "climate_suitability": "Tropical and subtropical"
+    },
+    "potato": {
+        "season": "rabi",
+        "duration": 90,
+        "water_requirement": "medium",
+        "soil_type": "sandy_loam",
+        "ph_range": (5.5, 6.5),
+        "yield_per_acre": 120,  # quintals
+        "market_price": 800,
+        "input_cost": 35000,
+        "profit_margin": 0.55,
+        "sowing_time": "October-November",
+        "harvest_time": "January-February",
+        "best_varieties": ["Kufri Pukhraj", "Kufri Jyoti", "Kufri Bahar"],
+        "fertilizer_requirement": {"N": 150, "P": 75, "K": 50},
+        "pest_management": ["Aphids", "Cutworms", "Late blight"],
+        "disease_resistance": "Moderate",
+        "climate_suitability": "Cool and moderate"
+    }
+}
+
+_AGRONOMY_TECHNIQUES: Final = {
+    "soil_health": {
+        "soil_testing": "Every 2-3 years for nutrient analysis",
+        "organic_matter": "Maintain 2-3% organic matter",
+        "crop_rotation": "Wheat-Rice-Maize rotation",
+        "green_manuring": "Sesbania or Dhaincha between crops",
+        "mulching": "Straw mulch for moisture retention"
+    },
+    "water_management": {
+        "drip_irrigation": "40-60% water saving",
+        "laser_land_leveling": "Improves water use efficiency by 25%",
+        "alternate_wetting_drying": "For rice cultivation",
+        "sprinkler_irrigation": "For wheat and maize",
+        "water_scheduling": "Based on crop growth stages"
+    },
+    "nutrient_management": {
+        "integrated_nutrient_management": "Combine organic and inorganic",
+        "site_specific_nutrient_management": "Based on soil testing",
+        "foliar_spray": "Micronutrients during critical stages",
+        "bio_fertilizers": "Rhizobium, Azotobacter, PSB",
+        "precision_farming": "GPS-guided fertilizer application"
+    },
+    "pest_management": {
+        "integrated_pest_management": "Cultural, biological, chemical",
+        "pheromone_traps": "For monitoring pest populations",
+        "biological_control": "Trichogramma, neem-based products",
+        "resistant_varieties": "Use disease-resistant crop varieties",
+        "crop_diversification": "Reduce pest pressure"
+    },
+    "precision_agriculture": {
+        "gps_guidance": "Accurate field operations",
+        "variable_rate_technology": "Site-specific input application",
+        "remote_sensing": "Crop health monitoring",
+        "yield_mapping": "Harvest yield data collection",
+        "automated_irrigation": "Sensor-based water management"
+    }
+}
+
+_PUNJAB_DATA: Final = {
+    "soil_types": {
+        "alluvial": "Most common, good for all crops",
+        "sandy_loam": "Good for vegetables and pulses",
+        "clay_loam": "Ideal for rice and sugarcane",
+        "loamy": "Best for wheat and maize"
+    },
+    "climate_zones": {
+        "sub_mountainous": "Hoshiarpur, Ropar - Good for horticulture",
+        "central_plains": "Ludhiana, Jalandhar - Wheat-rice belt",
+        "south_western": "Bathinda, Mansa - Cotton and oilseeds",
+        "malwa_region": "Patiala, Sangrur - Diversified farming"
+    },
+    "rainfall_pattern": {
+        "annual_rainfall": "600-800 mm",
+        "monsoon_season": "July-September",
+        "winter_rainfall": "December-February",
+        "irrigation_dependency": "80% of crops"
+    }
+}
+
+@dataclass(slots=True, frozen=True)
+class Crop:
+    """One crop catalog record. Frozen with slots so attribute reads are
+    fixed-offset loads instead of dict lookups and records stay immutable."""
+    season: str
+    duration: int
+    water_requirement: str
+    soil_type: str
+    ph_range: tuple
+    yield_per_acre: float
+    market_price: float
+    input_cost: int
+    profit_margin: float
+    sowing_time: str
+    harvest_time: str
+    best_varieties: List[str]
+    fertilizer_requirement: Dict[str, int]
+    pest_management: List[str]
+    disease_resistance: str
+    climate_suitability: str
+    # Derived once at construction so no call site re-multiplies
+    profit_per_acre: float = 0.0
+
+    def __post_init__(self):
+        object.__setattr__(self, "profit_per_acre",
+                           self.yield_per_acre * self.market_price * self.profit_margin)
+
+_CROPS: Final[Dict[str, Crop]] = {sys.intern(name): Crop(**raw) for name, raw in _CROPS_RAW.items()}
+
+# Hindi and English response templates share one render path: handlers
+# pick a language table and format it, instead of duplicating identical
+# structure across if language == "hi" branches.
+_TMPL: Final = {
+    "hi": {
+        "crop_header": """🌱 आपके लिए फसल सिफारिशें ({season} मौसम):
+
+📊 मिट्टी: {soil}
+📏 जमीन: {land} एकड़
+
+🏆 सर्वश्रेष्ठ फसलें:""",
+        "crop_item": """
+{i}. {name}
+   💰 लाभ: ₹{profit:,}/एकड़
+   📅 अवधि: {duration} दिन
+   💧 पानी: {water}
+   🌾 उपज: {yield_} क्विंटल/एकड़""",
+        "crop_footer": """
 
 💡 सुझाव:
-• {profitable_crops[0]['name'].title()} सबसे लाभदायक है
+• {best} सबसे लाभदायक है
 • बाजार के दामों पर नजर रखें
-• सरकारी सब्सिडी का लाभ उठाएं"""
-            
-            return response
-        else:
-            response = f"""🌱 Crop Recommendations for You ({current_season} season):
-
-📊 Soil: {soil_health.get('type', 'Unknown')}
-📏 Land: {land_area} acres
-
-🏆 Best Crops:"""
-            
-            for i, crop in enumerate(profitable_crops[:3], 1):
-                crop_data = crop["data"]
-                response += f"""
-{i}. {crop['name'].title()}
-   💰 Profit: ₹{crop['profit_per_acre']:,}/acre
-   📅 Duration: {crop_data.get('duration', 0)} days
-   💧 Water: {crop_data.get('water_requirement', 'Unknown')}
-   🌾 Yield: {crop_data.get('yield_per_acre', 0)} quintals/acre"""
-            
-            response += f"""
+• सरकारी सब्सिडी का लाभ उठाएं""",
+        "soil": """🌱 आपकी मिट्टी की जानकारी:
 
-💡 Tips:
-• {profitable_crops[0]['name'].title()} is most profitable
-• Monitor market prices
-• Avail government subsidies"""
-            
-            return response
-    
-    def _get_suitable_crops(self, soil_health: Dict, season: str) -> List[str]:
-        """Get suitable crops based on soil and season"""
-        soil_type = soil_health.get("type", "loamy")
-        season_crops = self.seasons.get(season, {}).get("crops", [])
-        
-        # Filter crops that are suitable for both soil and season
-        suitable_crops = []
-        for crop_name in season_crops:
-            crop_data = self.crops.get(crop_name, {})
-            if crop_data.get("soil_type") == soil_type:
-                suitable_crops.append(crop_name)
-        
-        # If no exact match, return season crops
-        return suitable_crops if suitable_crops else season_crops
-    
-    def _get_current_season(self) -> str:
-        """Get current agricultural season"""
-        current_month = datetime.now().month
-        
-        if current_month in [6, 7, 8, 9]:
-            return "kharif"
-        elif current_month in [10, 11, 12, 1]:
-            return "rabi"
-        else:
-            return "zaid"
-    
-    async def _handle_soil_health(self, user_context: Dict, language: str) -> str:
-        """Handle soil health queries"""
-        soil_health = user_context.get("soil_health", {})
-        ph_level = soil_health.get("ph", 7.0)
-        soil_type = soil_health.get("type", "loamy")
-        
-        # Analyze soil health
-        ph_status = "अच्छा" if 6.0 <= ph_level <= 7.5 else "सुधार की आवश्यकता"
-        soil_info = self.punjab_data.get("soil_types", {}).get(soil_type, {})
-        
-        if language == "hi":
-            return f"""🌱 आपकी मिट्टी की जानकारी:
-
-📊 pH स्तर: {ph_level} ({ph_status})
+📊 pH स्तर: {ph} ({status})
 🏗️ मिट्टी का प्रकार: {soil_type}
 💧 मिट्टी की विशेषता: {soil_info}
 
@@ -364,10 +291,29 @@ class AgronomyAgent:
 • हरी खाद का प्रयोग करें
 
 📞 मिट्टी परीक्षण के लिए कृषि विभाग से संपर्क करें।"""
-        else:
-            return f"""🌱 Your Soil Information:
+    },
+    "en": {
+        "crop_header": """🌱 Crop Recommendations for You ({season} season):
+
+📊 Soil: {soil}
+📏 Land: {land} acres
+
+🏆 Best Crops:""",
+        "crop_item": """
+{i}. {name}
+   💰 Profit: ₹{profit:,}/acre
+   📅 Duration: {duration} days
+   💧 Water: {water}
+   🌾 Yield: {yield_} quintals/acre""",
+        "crop_footer": """
+
+💡 Tips:
+• {best} is most profitable
+• Monitor market prices
+• Avail government subsidies""",
+        "soil": """🌱 Your Soil Information:
 
-📊 pH Level: {ph_level} ({ph_status})
+📊 pH Level: {ph} ({status})
 🏗️ Soil Type: {soil_type}
 💧 Soil Characteristics: {soil_info}
 
@@ -378,13 +324,89 @@ class AgronomyAgent:
 • Use green manure
 
 📞 Contact agriculture department for soil testing."""
+    }
+}
+
+@functools.lru_cache(maxsize=256)
+def _render_soil_health(ph_level: float, soil_type: str, soil_info: str, language: str) -> str:
+    """Render the soil health reply for one (ph, soil type, language) combo.
+
+    User soil readings are highly recurrent, so the rendered string is
+    memoized; callers bucket ph to one decimal before the lookup so nearby
+    readings share an entry.
+    """
+    ph_status = "अच्छा" if 6.0 <= ph_level <= 7.5 else "सुधार की आवश्यकता"
+    t = _TMPL["hi" if language == "hi" else "en"]
+    return t["soil"].format(ph=ph_level, status=ph_status, soil_type=soil_type, soil_info=soil_info)
+
+@functools.cache
+def _load_static_agronomy() -> SimpleNamespace:
+    """Build the derived static structures once per process.
+
+    SoA columns, code columns, inverted indexes and canned replies are
+    shared by every AgronomyAgent instance; after the first call,
+    per-instance initialization is just attribute binding. The NumPy
+    columns are frozen so shared state cannot be mutated in place.
+    """
+    ns = SimpleNamespace()
+    # Comprehensive crop data for Punjab
+    ns.crops = _CROPS
     
-    async def _handle_farming_practices(self, query: str, user_context: Dict, language: str) -> str:
-        """Handle farming practices queries"""
-        current_crops = user_context.get("current_crops", [])
-        
-        if language == "hi":
-            return f"""🌾 कृषि के सर्वोत्तम तरीके:
+    # Agronomy techniques and best practices
+    ns.agronomy_techniques = _AGRONOMY_TECHNIQUES
+    
+    # Punjab-specific soil and climate data
+    ns.punjab_data = _PUNJAB_DATA
+
+    # Columnar (SoA) views over the crop catalog. The profit-scoring hot
+    # path only reads a handful of numeric attributes per crop, so those
+    # live in parallel NumPy arrays indexed by position in
+    # ns._crop_names; the rich per-crop dicts in ns.crops stay as the
+    # cold path for rendering varieties, sowing windows, etc.
+    ns._crop_names = list(ns.crops.keys())
+    # Interned keys let these per-request lookups hit the pointer-equality
+    # fast path when callers pass literal crop/soil/season names
+    ns._name_to_idx = {sys.intern(name): i for i, name in enumerate(ns._crop_names)}
+    crop_values = list(ns.crops.values())
+    ns._yield = np.array([c.yield_per_acre for c in crop_values], dtype=np.float32)
+    ns._price = np.array([c.market_price for c in crop_values], dtype=np.float32)
+    ns._margin = np.array([c.profit_margin for c in crop_values], dtype=np.float32)
+    ns._duration = np.array([c.duration for c in crop_values], dtype=np.int32)
+    ns._water = [c.water_requirement for c in crop_values]
+    # Profit per acre is a pure function of static catalog values, so
+    # compute it once and keep a descending sort order alongside it;
+    # request-time top-K selection is then just a masked scan.
+    ns._profit = np.array([c.profit_per_acre for c in crop_values], dtype=np.float32)
+    ns._sorted_idx = np.argsort(-ns._profit)
+
+    # Dictionary-encode the low-cardinality string columns to uint8
+    # codes so filter predicates become integer equality over small
+    # contiguous arrays instead of per-crop string comparisons.
+    ns._soil_vocab = {sys.intern(s): i for i, s in enumerate(dict.fromkeys(c.soil_type for c in crop_values))}
+    ns._season_vocab = {sys.intern(s): i for i, s in enumerate(dict.fromkeys(c.season for c in crop_values))}
+    ns._water_vocab = {sys.intern(s): i for i, s in enumerate(dict.fromkeys(c.water_requirement for c in crop_values))}
+    ns._soil_codes = np.array([ns._soil_vocab[c.soil_type] for c in crop_values], dtype=np.uint8)
+    ns._season_codes = np.array([ns._season_vocab[c.season] for c in crop_values], dtype=np.uint8)
+    ns._water_codes = np.array([ns._water_vocab[c.water_requirement] for c in crop_values], dtype=np.uint8)
+    ns._year_round_code = ns._season_vocab.get("year_round")
+
+    # Inverted indexes from season / (season, soil type) to crop names.
+    # The old _get_suitable_crops read a ns.seasons mapping that was
+    # never built, so every call raised AttributeError and callers fell
+    # back to empty lists; building the indexes once here fixes that and
+    # makes the lookup O(1) instead of a scan over ns.crops.
+    ns._by_season = defaultdict(list)
+    ns._by_season_soil = defaultdict(list)
+    for name, crop in ns.crops.items():
+        seasons = ("kharif", "rabi", "zaid") if crop.season == "year_round" else (crop.season,)
+        for season in seasons:
+            ns._by_season[season].append(name)
+            ns._by_season_soil[(season, crop.soil_type)].append(name)
+
+    # Fully static replies, rendered once per process instead of being
+    # rebuilt from f-strings on every call.
+    ns._static_responses = {
+        ("hi", "farming_practices"): """🌾 कृषि के सर्वोत्तम तरीके:
 
 📅 समय पर बुवाई करें
 💧 सिंचाई का ध्यान रखें
@@ -398,9 +420,8 @@ class AgronomyAgent:
 • प्रेसिजन फार्मिंग
 • मल्चिंग
 
-📚 कृषि विभाग से प्रशिक्षण लें।"""
-        else:
-            return f"""🌾 Best Farming Practices:
+📚 कृषि विभाग से प्रशिक्षण लें।""",
+        ("en", "farming_practices"): """🌾 Best Farming Practices:
 
 📅 Sow at the right time
 💧 Manage irrigation properly
@@ -414,14 +435,8 @@ class AgronomyAgent:
 • Precision farming
 • Mulching
 
-📚 Get training from agriculture department."""
-    
-    async def _handle_pest_management(self, user_context: Dict, language: str) -> str:
-        """Handle pest management queries"""
-        current_crops = user_context.get("current_crops", [])
-        
-        if language == "hi":
-            return f"""🐛 कीट प्रबंधन सलाह:
+📚 Get training from agriculture department.""",
+        ("hi", "pest_management"): """🐛 कीट प्रबंधन सलाह:
 
 🔍 नियमित निरीक्षण करें
 🌿 जैविक कीटनाशक प्रयोग करें
@@ -434,9 +449,8 @@ class AgronomyAgent:
 • सुरक्षा उपकरण पहनें
 • फसल कटाई से पहले अंतराल रखें
 
-📞 कीट समस्या के लिए कृषि विभाग से संपर्क करें।"""
-        else:
-            return f"""🐛 Pest Management Advice:
+📞 कीट समस्या के लिए कृषि विभाग से संपर्क करें।""",
+        ("en", "pest_management"): """🐛 Pest Management Advice:
 
 🔍 Regular monitoring
 🌿 Use organic pesticides
@@ -449,12 +463,8 @@ class AgronomyAgent:
 • Wear safety equipment
 • Maintain gap before harvest
 
-📞 Contact agriculture department for pest problems."""
-    
-    async def _handle_general_agronomy_query(self, query: str, user_context: Dict, language: str) -> str:
-        """Handle general agronomy queries"""
-        if language == "hi":
-            return """🌱 कृषि सलाह:
+📞 Contact agriculture department for pest problems.""",
+        ("hi", "general"): """🌱 कृषि सलाह:
 
 • मिट्टी की जांच नियमित करें
 • उचित फसल चुनें
@@ -462,9 +472,8 @@ class AgronomyAgent:
 • कीट प्रबंधन करें
 • बाजार के दामों पर नजर रखें
 
-क्या आप फसल, मिट्टी या कीट प्रबंधन के बारे में जानना चाहते हैं?"""
-        else:
-            return """🌱 Agricultural Advice:
+क्या आप फसल, मिट्टी या कीट प्रबंधन के बारे में जानना चाहते हैं?""",
+        ("en", "general"): """🌱 Agricultural Advice:
 
 • Get regular soil testing
 • Choose appropriate crops
@@ -472,14 +481,238 @@ class AgronomyAgent:
 • Control pests
 • Monitor market prices
 
-Do you want to know about crops, soil, or pest management?"""
+Do you want to know about crops, soil, or pest management?""",
+        ("hi", "error"): "माफ़ करें, कृषि सलाह देने में समस्या आ रही है। कृपया कुछ देर बाद फिर से कोशिश करें।",
+        ("en", "error"): "Sorry, there's an issue providing agricultural advice. Please try again later."
+    }
+
+    for column in (ns._yield, ns._price, ns._margin, ns._duration, ns._profit,
+                   ns._sorted_idx, ns._soil_codes, ns._season_codes, ns._water_codes):
+        column.setflags(write=False)
+    ns._by_season = dict(ns._by_season)
+    ns._by_season_soil = dict(ns._by_season_soil)
+    return ns
+
+class AgronomyAgent:
+    """
+    Agronomy Agent - Handles crop recommendations, soil health analysis,
+    and farming best practices for Indian farmers.
+    """
+    
+    def __init__(self):
+        self.name = "Agronomy Agent"
+        self.description = "Specialized in crop science, soil health, and farming techniques"
+        self.initialized = False
+        # Responses are deterministic in a small bucketed key space
+        # (query type, soil type, ph, land area, season, language), and
+        # real traffic repeats those combos heavily, so memoize the whole
+        # computation per instance.
+        self._compute_response_cached = functools.lru_cache(maxsize=1024)(self._compute_response)
+        
+    async def initialize(self):
+        """Initialize the agronomy agent with crop and soil data"""
+        try:
+            await self._load_agronomy_data()
+            self.initialized = True
+            logger.info("🌱 Agronomy Agent initialized successfully")
+        except Exception as e:
+            logger.error(f"❌ Error initializing Agronomy Agent: {e}")
+            raise
+    
+    async def _load_agronomy_data(self):
+        """Bind the process-wide static agronomy structures to this instance"""
+        for name, value in vars(_load_static_agronomy()).items():
+            setattr(self, name, value)
+
+        # Recommendation blocks depend only on (season, soil type), so
+        # build each combination once up front. Kept as plain dicts:
+        # FastAPI runs jsonable_encoder on handler return values, which
+        # cannot pass pre-serialized bytes through untouched.
+        self._reco_blocks = {
+            (season, soil): self._recommendation_block(season, soil)
+            for season in (*self._season_vocab, "zaid")
+            for soil in self._soil_vocab
+        }
+
+    def _recommendation_block(self, season: str, soil_type: str) -> List[Dict[str, Any]]:
+        """Top-3 recommendation dicts for one (season, soil type) combo"""
+        idx = self._indices_for(season, soil_type, limit=3)
+        return [
+            {
+                "crop": self._crop_names[int(i)],
+                "profit_per_acre": float(self._profit[i]),
+                "duration": int(self._duration[i]),
+                "water_requirement": self._water[int(i)]
+            }
+            for i in idx
+        ]
     
+    def _static_response(self, language: str, key: str) -> str:
+        """Look up a pre-rendered static reply (Hindi or English)."""
+        return self._static_responses[("hi" if language == "hi" else "en", key)]
+
+    def _top_k_by_profit(self, idx: np.ndarray, limit: Optional[int]) -> np.ndarray:
+        """Keep the `limit` most profitable of the given indices, sorted.
+
+        argpartition selects the top K in O(N), then only those K are
+        sorted — O(N log K) as the catalog grows instead of ordering every
+        candidate.
+        """
+        if limit is not None and idx.size > limit:
+            idx = idx[np.argpartition(-self._profit[idx], limit - 1)[:limit]]
+        return idx[np.argsort(-self._profit[idx])]
+
+    def _profit_ranking(self, crop_names: List[str], limit: Optional[int] = None) -> List[tuple]:
+        """Rank the given crops by profit per acre (descending).
+
+        Returns up to `limit` (crop_name, profit_per_acre) pairs read from
+        the precomputed profit column.
+        """
+        idx = np.array(
+            [self._name_to_idx[name] for name in crop_names if name in self._name_to_idx],
+            dtype=np.intp
+        )
+        top = self._top_k_by_profit(idx, limit)
+        return [(self._crop_names[int(i)], float(self._profit[i])) for i in top]
+
+    def _indices_for(self, season: str, soil_type: str, limit: Optional[int] = None) -> np.ndarray:
+        """Candidate crop indices for (season, soil type), profit-descending.
+
+        Filters on the uint8 code columns; year-round crops count for every
+        season, and the soil filter falls back to the whole season like
+        _get_suitable_crops.
+        """
+        season_mask = self._season_codes == self._season_vocab.get(season, 0xFF)
+        if self._year_round_code is not None:
+            season_mask = season_mask | (self._season_codes == self._year_round_code)
+        soil_mask = season_mask & (self._soil_codes == self._soil_vocab.get(soil_type, 0xFF))
+        mask = soil_mask if soil_mask.any() else season_mask
+        return self._top_k_by_profit(np.flatnonzero(mask), limit)
+
+    async def process(self, query: str, user_context: Dict, language: str = "hi") -> str:
+        """Process agronomy-related queries"""
+        try:
+            # Analyze query type
+            query_type = self._analyze_agronomy_query(query)
+
+            # Bucket the continuous context fields so recurrent users land
+            # on the same memo entry; ph to one decimal, land to the acre.
+            soil_health = user_context.get("soil_health", {})
+            soil_type = soil_health.get("type", "loamy")
+            ph_bucket = round(soil_health.get("ph", 7.0), 1)
+            land_bucket = round(user_context.get("land_area", 0))
+            season = self._get_current_season()
+
+            # Keep unknown soil types out of the cache key space so bad
+            # input can't evict useful entries
+            if soil_type in self._soil_vocab or soil_type in self.punjab_data["soil_types"]:
+                return self._compute_response_cached(
+                    query_type, soil_type, ph_bucket, land_bucket, season, language)
+            return self._compute_response(
+                query_type, soil_type, ph_bucket, land_bucket, season, language)
+
+        except Exception as e:
+            logger.error(f"❌ Error in Agronomy Agent: {e}")
+            return self._get_error_response(language)
+
+    def _compute_response(self, query_type: str, soil_type: str, ph_bucket: float,
+                          land_bucket: int, season: str, language: str) -> str:
+        """Pure response computation over the bucketed context key."""
+        user_context = {
+            "soil_health": {"ph": ph_bucket, "type": soil_type},
+            "land_area": land_bucket
+        }
+        if query_type == "crop_recommendation":
+            return self._handle_crop_recommendation(user_context, language)
+        elif query_type == "soil_health":
+            return self._handle_soil_health(user_context, language)
+        elif query_type == "farming_practices":
+            return self._handle_farming_practices("", user_context, language)
+        elif query_type == "pest_management":
+            return self._handle_pest_management(user_context, language)
+        else:
+            return self._handle_general_agronomy_query("", user_context, language)
+    
+    def _analyze_agronomy_query(self, query: str) -> str:
+        """Analyze the type of agronomy query"""
+        query_lower = query.lower()
+        matched = {query_type for _, query_type in _QUERY_AUTOMATON.iter(query_lower)}
+        for query_type in _QUERY_TYPE_PRIORITY:
+            if query_type in matched:
+                return query_type
+        return "general"
+    
+    def _handle_crop_recommendation(self, user_context: Dict, language: str) -> str:
+        """Handle crop recommendation queries"""
+        soil_health = user_context.get("soil_health", {})
+        land_area = user_context.get("land_area", 0)
+        current_season = self._get_current_season()
+        
+        # Get suitable crops based on soil and season
+        suitable_crops = self._get_suitable_crops(soil_health, current_season)
+        
+        # Rank by profitability (vectorized over the SoA columns)
+        profitable_crops = [
+            {"name": name, "profit_per_acre": profit, "data": self.crops[name]}
+            for name, profit in self._profit_ranking(suitable_crops, limit=3)
+        ]
+        
+        # One render path for both languages; collect fragments and join
+        # once instead of growing the response with +=
+        t = _TMPL["hi" if language == "hi" else "en"]
+        parts = [t["crop_header"].format(
+            season=current_season,
+            soil=soil_health.get("type", "Unknown"),
+            land=land_area
+        )]
+        for i, crop in enumerate(profitable_crops, 1):
+            crop_data = crop["data"]
+            parts.append(t["crop_item"].format(
+                i=i,
+                name=crop["name"].title(),
+                profit=crop["profit_per_acre"],
+                duration=crop_data.duration,
+                water=crop_data.water_requirement,
+                yield_=crop_data.yield_per_acre
+            ))
+        parts.append(t["crop_footer"].format(best=profitable_crops[0]["name"].title()))
+        return "".join(parts)
+    
+    def _get_suitable_crops(self, soil_health: Dict, season: str) -> List[str]:
+        """Get suitable crops based on soil and season"""
+        soil_type = soil_health.get("type", "loamy")
+        # Fall back to all crops of the season when no exact soil match
+        return (self._by_season_soil.get((season, soil_type))
+                or self._by_season.get(season, []))
+    
+    def _get_current_season(self) -> str:
+        """Get current agricultural season"""
+        return _season_for_hour(int(time.time() // 3600))
+    
+    def _handle_soil_health(self, user_context: Dict, language: str) -> str:
+        """Handle soil health queries"""
+        soil_health = user_context.get("soil_health", {})
+        # Bucket ph to one decimal so recurrent readings hit the memo cache
+        ph_level = round(soil_health.get("ph", 7.0), 1)
+        soil_type = soil_health.get("type", "loamy")
+        soil_info = self.punjab_data.get("soil_types", {}).get(soil_type, "")
+        return _render_soil_health(ph_level, soil_type, soil_info, language)
+
+    def _handle_farming_practices(self, query: str, user_context: Dict, language: str) -> str:
+        """Handle farming practices queries"""
+        return self._static_response(language, "farming_practices")
+
+    def _handle_pest_management(self, user_context: Dict, language: str) -> str:
+        """Handle pest management queries"""
+        return self._static_response(language, "pest_management")
+
+    def _handle_general_agronomy_query(self, query: str, user_context: Dict, language: str) -> str:
+        """Handle general agronomy queries"""
+        return self._static_response(language, "general")
+
     def _get_error_response(self, language: str) -> str:
         """Error response in appropriate language"""
-        if language == "hi":
-            return "माफ़ करें, कृषि सलाह देने में समस्या आ रही है। कृपया कुछ देर बाद फिर से कोशिश करें।"
-        else:
-            return "Sorry, there's an issue providing agricultural advice. Please try again later."
+        return self._static_response(language, "error")
     
     async def get_crop_recommendations(self, user_id: str, season: str) -> Dict[str, Any]:
         """Get detailed crop recommendations for a user"""
@@ -490,22 +723,14 @@ Do you want to know about crops, soil, or pest management?"""
             "land_area": 5.0,
             "location": "Punjab"
         }
-        
-        suitable_crops = self._get_suitable_crops(user_context["soil_health"], season)
-        recommendations = []
-        
-        for crop_name in suitable_crops[:3]:
-            crop_data = self.crops.get(crop_name, {})
-            if crop_data:
-                recommendations.append({
-                    "crop": crop_name,
-                    "profit_per_acre": crop_data.get("yield_per_acre", 0) * 
-                                     crop_data.get("market_price", 0) * 
-                                     crop_data.get("profit_margin", 0),
-                    "duration": crop_data.get("duration", 0),
-                    "water_requirement": crop_data.get("water_requirement", "Unknown")
-                })
-        
+
+        # Known (season, soil) combos were built once at load time, so the
+        # static block never gets recomputed per request
+        soil_type = user_context["soil_health"]["type"]
+        pre = self._reco_blocks.get((season, soil_type))
+        recommendations = (pre if pre is not None
+                           else self._recommendation_block(season, soil_type))
+
         return {
             "user_id": user_id,
             "season": season,
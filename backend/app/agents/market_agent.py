@@ -1,10 +1,378 @@
 import asyncio
+import functools
+import sys
 import json
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Final, List, Any, Optional
 from datetime import datetime, timedelta
+import ahocorasick
+import numpy as np
 from loguru import logger
 from app.core.config import settings
 
+# Keyword lists for query-type classification, compiled once into an
+# Aho-Corasick automaton so a query is scanned in a single pass. Some
+# keywords (mandi, market) belong to several categories, so each word
+# maps to the set of query types it can signal.
+_QUERY_KEYWORDS: Final = {
+    "price_inquiry": ["price", "rate", "bhav", "dum", "cost"],
+    "selling_strategy": ["sell", "bikri", "mandi", "market"],
+    "mandi_info": ["mandi", "market", "haat"],
+    "demand_forecast": ["demand", "trend", "future", "forecast"],
+}
+
+# Same precedence as the old if/elif chain
+_QUERY_TYPE_PRIORITY: Final = ("price_inquiry", "selling_strategy", "mandi_info", "demand_forecast")
+
+def _build_query_automaton() -> "ahocorasick.Automaton":
+    payloads: Dict[str, set] = {}
+    for query_type, words in _QUERY_KEYWORDS.items():
+        for word in words:
+            payloads.setdefault(word, set()).add(query_type)
+    automaton = ahocorasick.Automaton()
+    for word, query_types in payloads.items():
+        automaton.add_word(word, frozenset(query_types))
+    automaton.make_automaton()
+    return automaton
+
+_QUERY_AUTOMATON = _build_query_automaton()
+
+# Localized trend labels in one flat (trend, language) table; unknown
+# trends fall through to the raw value, as before.
+_TREND_TABLE: Final[Dict[tuple, str]] = {
+    ("rising", "hi"): "बढ़ रहा है",
+    ("falling", "hi"): "गिर रहा है",
+    ("stable", "hi"): "स्थिर है",
+    ("rising", "en"): "Rising",
+    ("falling", "en"): "Falling",
+    ("stable", "en"): "Stable",
+}
+
+# str.format-ready response fragments, keyed by language. Handlers
+# append rendered rows to a list and join once at the end instead of
+# growing a string with += and re-parsing f-string literals per call.
+_TMPL: Final[Dict[str, Dict[str, str]]] = {
+    "hi": {
+        "price_header": "📊 आपकी फसलों के बाजार भाव:\n\n",
+        "price_row": """🌾 {crop}:
+💰 वर्तमान भाव: ₹{current:,}/क्विंटल
+📈 सर्वोच्च भाव: ₹{highest:,}/क्विंटल
+📉 न्यूनतम भाव: ₹{lowest:,}/क्विंटल
+📊 रुझान: {trend}
+🏪 सर्वोत्तम मंडी: {best_mandi}
+⏰ सर्वोत्तम समय: {best_time}
+
+""",
+        "price_footer": """💡 सुझाव:
+• बाजार के रुझान पर नजर रखें
+• सर्वोत्तम समय पर बेचें
+• कई मंडियों के भाव तुलना करें""",
+        "strategy_header": "💡 आपकी फसल बिक्री रणनीति:\n\n",
+        "strategy_row": """🌾 {crop}:
+🏪 सर्वोत्तम मंडी: {mandi}
+💰 शुद्ध भाव: ₹{net_price:,}/क्विंटल
+⏰ सर्वोत्तम समय: {timing}
+
+""",
+        "strategy_footer": """📋 बिक्री के लिए सुझाव:
+• फसल की गुणवत्ता बनाए रखें
+• सही पैकिंग करें
+• परिवहन की व्यवस्था पहले करें
+• बैंक गारंटी लें""",
+    },
+    "en": {
+        "price_header": "📊 Market Prices for Your Crops:\n\n",
+        "price_row": """🌾 {crop}:
+💰 Current Price: ₹{current:,}/quintal
+📈 Highest Price: ₹{highest:,}/quintal
+📉 Lowest Price: ₹{lowest:,}/quintal
+📊 Trend: {trend}
+🏪 Best Mandi: {best_mandi}
+⏰ Best Time: {best_time}
+
+""",
+        "price_footer": """💡 Tips:
+• Monitor market trends
+• Sell at optimal time
+• Compare prices across mandis""",
+        "strategy_header": "💡 Selling Strategy for Your Crops:\n\n",
+        "strategy_row": """🌾 {crop}:
+🏪 Best Mandi: {mandi}
+💰 Net Price: ₹{net_price:,}/quintal
+⏰ Best Time: {timing}
+
+""",
+        "strategy_footer": """📋 Selling Tips:
+• Maintain crop quality
+• Proper packaging
+• Arrange transport in advance
+• Get bank guarantee""",
+    },
+}
+
+# Static market datasets for Punjab, built once at import and shared
+# by every MarketAgent instance as read-only views instead of being
+# reconstructed inside each initialize() call.
+# Current market prices for Punjab mandis
+_CURRENT_PRICES = MappingProxyType({
+    "wheat": {
+        "bathinda": 2150,
+        "ludhiana": 2180,
+        "amritsar": 2160,
+        "jalandhar": 2170,
+        "patiala": 2140,
+        "trend": "stable",
+        "last_updated": "2024-08-18"
+    },
+    "rice": {
+        "bathinda": 1850,
+        "ludhiana": 1880,
+        "amritsar": 1860,
+        "jalandhar": 1870,
+        "patiala": 1840,
+        "trend": "increasing",
+        "last_updated": "2024-08-18"
+    },
+    "maize": {
+        "bathinda": 1650,
+        "ludhiana": 1680,
+        "amritsar": 1660,
+        "jalandhar": 1670,
+        "patiala": 1640,
+        "trend": "stable",
+        "last_updated": "2024-08-18"
+    },
+    "cotton": {
+        "bathinda": 6700,
+        "ludhiana": 6750,
+        "amritsar": 6720,
+        "jalandhar": 6730,
+        "patiala": 6680,
+        "trend": "decreasing",
+        "last_updated": "2024-08-18"
+    },
+    "sugarcane": {
+        "bathinda": 320,
+        "ludhiana": 325,
+        "amritsar": 322,
+        "jalandhar": 323,
+        "patiala": 318,
+        "trend": "stable",
+        "last_updated": "2024-08-18"
+    },
+    "potato": {
+        "bathinda": 850,
+        "ludhiana": 880,
+        "amritsar": 860,
+        "jalandhar": 870,
+        "patiala": 840,
+        "trend": "increasing",
+        "last_updated": "2024-08-18"
+    }
+})
+
+# Demand forecasting for next 6 months
+_DEMAND_FORECAST = MappingProxyType({
+    "wheat": {
+        "current_demand": "high",
+        "next_3_months": "stable",
+        "next_6_months": "increasing",
+        "reason": "Festival season and export demand",
+        "recommended_action": "Hold stocks for better prices"
+    },
+    "rice": {
+        "current_demand": "very_high",
+        "next_3_months": "increasing",
+        "next_6_months": "stable",
+        "reason": "Export opportunities and domestic consumption",
+        "recommended_action": "Sell in next 2 months"
+    },
+    "maize": {
+        "current_demand": "medium",
+        "next_3_months": "increasing",
+        "next_6_months": "high",
+        "reason": "Poultry feed industry demand",
+        "recommended_action": "Store for better prices"
+    },
+    "cotton": {
+        "current_demand": "low",
+        "next_3_months": "stable",
+        "next_6_months": "increasing",
+        "reason": "Textile industry recovery expected",
+        "recommended_action": "Wait for price improvement"
+    },
+    "sugarcane": {
+        "current_demand": "high",
+        "next_3_months": "stable",
+        "next_6_months": "stable",
+        "reason": "Sugar mills demand",
+        "recommended_action": "Sell to nearby mills"
+    },
+    "potato": {
+        "current_demand": "very_high",
+        "next_3_months": "decreasing",
+        "next_6_months": "low",
+        "reason": "Seasonal demand pattern",
+        "recommended_action": "Sell immediately"
+    }
+})
+
+# Canonical crop keys are interned so the per-crop hot-path lookups
+# hash by pointer compare rather than re-hashing the query string.
+_CURRENT_PRICES = MappingProxyType({sys.intern(name): data for name, data in _CURRENT_PRICES.items()})
+_DEMAND_FORECAST = MappingProxyType({sys.intern(name): data for name, data in _DEMAND_FORECAST.items()})
+
+# Punjab mandi information
+_MANDI_INFO = MappingProxyType({
+    "bathinda": {
+        "name": "Bathinda Grain Market",
+        "location": "Bathinda, Punjab",
+        "contact": "0164-2223456",
+        "specialization": "Wheat, Rice, Cotton",
+        "storage_capacity": "50000 MT",
+        "transport_links": "Rail and Road",
+        "processing_units": 15
+    },
+    "ludhiana": {
+        "name": "Ludhiana Grain Market",
+        "location": "Ludhiana, Punjab",
+        "contact": "0161-2223456",
+        "specialization": "Wheat, Rice, Maize",
+        "storage_capacity": "75000 MT",
+        "transport_links": "Rail, Road, Air",
+        "processing_units": 25
+    },
+    "amritsar": {
+        "name": "Amritsar Grain Market",
+        "location": "Amritsar, Punjab",
+        "contact": "0183-2223456",
+        "specialization": "Wheat, Rice, Potato",
+        "storage_capacity": "40000 MT",
+        "transport_links": "Rail and Road",
+        "processing_units": 12
+    },
+    "jalandhar": {
+        "name": "Jalandhar Grain Market",
+        "location": "Jalandhar, Punjab",
+        "contact": "0181-2223456",
+        "specialization": "Wheat, Rice, Sugarcane",
+        "storage_capacity": "35000 MT",
+        "transport_links": "Rail and Road",
+        "processing_units": 10
+    },
+    "patiala": {
+        "name": "Patiala Grain Market",
+        "location": "Patiala, Punjab",
+        "contact": "0175-2223456",
+        "specialization": "Wheat, Rice, Vegetables",
+        "storage_capacity": "30000 MT",
+        "transport_links": "Rail and Road",
+        "processing_units": 8
+    }
+})
+
+# Market trends and analysis
+_MARKET_TRENDS = MappingProxyType({
+    "seasonal_patterns": {
+        "wheat": "Peak prices in March-April, Low in September-October",
+        "rice": "Peak prices in November-December, Low in June-July",
+        "maize": "Peak prices in January-February, Low in August-September",
+        "cotton": "Peak prices in December-January, Low in May-June",
+        "sugarcane": "Stable prices throughout year",
+        "potato": "Peak prices in December-January, Low in March-April"
+    },
+    "export_opportunities": {
+        "wheat": "Middle East, Africa - High demand",
+        "rice": "Gulf countries, Europe - Premium prices",
+        "maize": "Southeast Asia - Growing demand",
+        "cotton": "Bangladesh, Vietnam - Textile industry",
+        "sugarcane": "Limited export opportunities",
+        "potato": "Nepal, Bangladesh - Seasonal demand"
+    },
+    "price_factors": {
+        "weather": "Drought/flood affects supply and prices",
+        "government_policy": "MSP, export restrictions impact prices",
+        "global_markets": "International prices influence local rates",
+        "demand_supply": "Festival seasons, industrial demand",
+        "transport_cost": "Fuel prices affect mandi prices",
+        "storage_availability": "Warehouse capacity affects prices"
+    }
+})
+
+# Derived per-mandi costs, computed once from the transport links and
+# processing units so no handler re-scans those strings per request.
+for _mandi in _MANDI_INFO.values():
+    _mandi["transport_cost"] = (_mandi["transport_links"].count("Rail") * 100
+                                + _mandi["transport_links"].count("Road") * 50)
+    _mandi["commission_pct"] = _mandi["processing_units"] * 0.5
+
+# Mandis indexed by state, so the info handler resolves a location
+# with one dict lookup instead of a startswith scan over every record.
+_MANDIS_BY_STATE: Dict[str, list] = {}
+for _mandi in _MANDI_INFO.values():
+    _state = _mandi["location"].rsplit(", ", 1)[-1]
+    _MANDIS_BY_STATE.setdefault(_state, []).append({"name": _mandi["name"], "data": _mandi})
+
+# Columnar (SoA) view of the per-mandi price table: one int32 row per
+# crop and one column per mandi, with parallel per-mandi transport-cost
+# and commission vectors derived from the mandi records. Net-price math
+# runs as one vector expression per crop instead of per-mandi lookups
+# on boxed ints.
+_MANDI_NAMES: Final = tuple(_MANDI_INFO.keys())
+_CROP_NAMES: Final = tuple(_CURRENT_PRICES.keys())
+_CROP_IDX: Final[Dict[str, int]] = {sys.intern(name): idx for idx, name in enumerate(_CROP_NAMES)}
+_PRICES = np.array(
+    [[_CURRENT_PRICES[crop][mandi] for mandi in _MANDI_NAMES] for crop in _CROP_NAMES],
+    dtype=np.int32
+)
+_TRANSPORT = np.array(
+    [_MANDI_INFO[mandi]["transport_cost"] for mandi in _MANDI_NAMES],
+    dtype=np.float64
+)
+_COMMISSION = np.array(
+    [_MANDI_INFO[mandi]["commission_pct"] for mandi in _MANDI_NAMES],
+    dtype=np.float64
+)
+for _array in (_PRICES, _TRANSPORT, _COMMISSION):
+    _array.setflags(write=False)
+
+def _best_mandi(prices_row: "np.ndarray", transport: "np.ndarray", commission: "np.ndarray") -> tuple:
+    """Pick the most profitable mandi for one crop's price row.
+
+    Net price is price * (1 - commission%) - transport across all mandis
+    at once. Kept as a pure arrays-in/scalars-out kernel (the signature
+    an njit-compiled drop-in would take) and warmed once at import.
+    """
+    net = prices_row * (1.0 - commission / 100.0) - transport
+    best = int(np.argmax(net))
+    return best, float(net[best])
+
+_best_mandi(_PRICES[0], _TRANSPORT, _COMMISSION)
+
+# Selling strategies and recommendations
+_SELLING_STRATEGIES = MappingProxyType({
+    "immediate_sale": {
+        "crops": ["potato", "vegetables"],
+        "reason": "Perishable nature",
+        "mandi_recommendation": "Nearest mandi for freshness"
+    },
+    "staggered_sale": {
+        "crops": ["wheat", "rice"],
+        "reason": "Stable prices, storage possible",
+        "mandi_recommendation": "Multiple mandis for better prices"
+    },
+    "contract_farming": {
+        "crops": ["cotton", "sugarcane"],
+        "reason": "Assured prices, market security",
+        "mandi_recommendation": "Direct to processing units"
+    },
+    "value_addition": {
+        "crops": ["maize", "pulses"],
+        "reason": "Higher profit margins",
+        "mandi_recommendation": "Process before selling"
+    }
+})
+
 class MarketAgent:
     """
     Market Agent - Handles market prices, demand forecasting, and optimal selling strategies
@@ -15,261 +383,81 @@ class MarketAgent:
         self.name = "Market Agent"
         self.description = "Specialized in market intelligence, price forecasting, and selling strategies"
         self.initialized = False
+        # Responses are pure functions of the query type and a small
+        # projection of the user context, so identical farmer profiles
+        # share a cached rendering.
+        self._compute_response_cached = functools.lru_cache(maxsize=4096)(self._compute_response)
         
     async def initialize(self):
         """Initialize the market agent with price and demand data"""
         try:
-            await self._load_market_data()
+            # Bind prices, demand trends, mandi and strategy data
+            self._load_market_data()
+            # One entry per (language, query type) with the language
+            # pre-bound, so dispatch is a single dict lookup instead of
+            # branching first on query type and again on language.
+            self._dispatch = {
+                (lang, query_type): functools.partial(handler, language=lang)
+                for lang in ("hi", "en")
+                for query_type, handler in (
+                    ("price_inquiry", self._handle_price_inquiry),
+                    ("selling_strategy", self._handle_selling_strategy),
+                    ("mandi_info", self._handle_mandi_info),
+                    ("demand_forecast", self._handle_demand_forecast),
+                )
+            }
             self.initialized = True
             logger.info("📊 Market Agent initialized successfully")
         except Exception as e:
             logger.error(f"❌ Error initializing Market Agent: {e}")
             raise
     
-    async def _load_market_data(self):
-        """Load market data including prices, demand trends, etc."""
-        # Current market prices for Punjab mandis
-        self.current_prices = {
-            "wheat": {
-                "bathinda": 2150,
-                "ludhiana": 2180,
-                "amritsar": 2160,
-                "jalandhar": 2170,
-                "patiala": 2140,
-                "trend": "stable",
-                "last_updated": "2024-08-18"
-            },
-            "rice": {
-                "bathinda": 1850,
-                "ludhiana": 1880,
-                "amritsar": 1860,
-                "jalandhar": 1870,
-                "patiala": 1840,
-                "trend": "increasing",
-                "last_updated": "2024-08-18"
-            },
-            "maize": {
-                "bathinda": 1650,
-                "ludhiana": 1680,
-                "amritsar": 1660,
-                "jalandhar": 1670,
-                "patiala": 1640,
-                "trend": "stable",
-                "last_updated": "2024-08-18"
-            },
-            "cotton": {
-                "bathinda": 6700,
-                "ludhiana": 6750,
-                "amritsar": 6720,
-                "jalandhar": 6730,
-                "patiala": 6680,
-                "trend": "decreasing",
-                "last_updated": "2024-08-18"
-            },
-            "sugarcane": {
-                "bathinda": 320,
-                "ludhiana": 325,
-                "amritsar": 322,
-                "jalandhar": 323,
-                "patiala": 318,
-                "trend": "stable",
-                "last_updated": "2024-08-18"
-            },
-            "potato": {
-                "bathinda": 850,
-                "ludhiana": 880,
-                "amritsar": 860,
-                "jalandhar": 870,
-                "patiala": 840,
-                "trend": "increasing",
-                "last_updated": "2024-08-18"
-            }
-        }
-        
-        # Demand forecasting for next 6 months
-        self.demand_forecast = {
-            "wheat": {
-                "current_demand": "high",
-                "next_3_months": "stable",
-                "next_6_months": "increasing",
-                "reason": "Festival season and export demand",
-                "recommended_action": "Hold stocks for better prices"
-            },
-            "rice": {
-                "current_demand": "very_high",
-                "next_3_months": "increasing",
-                "next_6_months": "stable",
-                "reason": "Export opportunities and domestic consumption",
-                "recommended_action": "Sell in next 2 months"
-            },
-            "maize": {
-                "current_demand": "medium",
-                "next_3_months": "increasing",
-                "next_6_months": "high",
-                "reason": "Poultry feed industry demand",
-                "recommended_action": "Store for better prices"
-            },
-            "cotton": {
-                "current_demand": "low",
-                "next_3_months": "stable",
-                "next_6_months": "increasing",
-                "reason": "Textile industry recovery expected",
-                "recommended_action": "Wait for price improvement"
-            },
-            "sugarcane": {
-                "current_demand": "high",
-                "next_3_months": "stable",
-                "next_6_months": "stable",
-                "reason": "Sugar mills demand",
-                "recommended_action": "Sell to nearby mills"
-            },
-            "potato": {
-                "current_demand": "very_high",
-                "next_3_months": "decreasing",
-                "next_6_months": "low",
-                "reason": "Seasonal demand pattern",
-                "recommended_action": "Sell immediately"
-            }
-        }
-        
-        # Punjab mandi information
-        self.mandi_info = {
-            "bathinda": {
-                "name": "Bathinda Grain Market",
-                "location": "Bathinda, Punjab",
-                "contact": "0164-2223456",
-                "specialization": "Wheat, Rice, Cotton",
-                "storage_capacity": "50000 MT",
-                "transport_links": "Rail and Road",
-                "processing_units": 15
-            },
-            "ludhiana": {
-                "name": "Ludhiana Grain Market",
-                "location": "Ludhiana, Punjab",
-                "contact": "0161-2223456",
-                "specialization": "Wheat, Rice, Maize",
-                "storage_capacity": "75000 MT",
-                "transport_links": "Rail, Road, Air",
-                "processing_units": 25
-            },
-            "amritsar": {
-                "name": "Amritsar Grain Market",
-                "location": "Amritsar, Punjab",
-                "contact": "0183-2223456",
-                "specialization": "Wheat, Rice, Potato",
-                "storage_capacity": "40000 MT",
-                "transport_links": "Rail and Road",
-                "processing_units": 12
-            },
-            "jalandhar": {
-                "name": "Jalandhar Grain Market",
-                "location": "Jalandhar, Punjab",
-                "contact": "0181-2223456",
-                "specialization": "Wheat, Rice, Sugarcane",
-                "storage_capacity": "35000 MT",
-                "transport_links": "Rail and Road",
-                "processing_units": 10
-            },
-            "patiala": {
-                "name": "Patiala Grain Market",
-                "location": "Patiala, Punjab",
-                "contact": "0175-2223456",
-                "specialization": "Wheat, Rice, Vegetables",
-                "storage_capacity": "30000 MT",
-                "transport_links": "Rail and Road",
-                "processing_units": 8
-            }
-        }
-        
-        # Market trends and analysis
-        self.market_trends = {
-            "seasonal_patterns": {
-                "wheat": "Peak prices in March-April, Low in September-October",
-                "rice": "Peak prices in November-December, Low in June-July",
-                "maize": "Peak prices in January-February, Low in August-September",
-                "cotton": "Peak prices in December-January, Low in May-June",
-                "sugarcane": "Stable prices throughout year",
-                "potato": "Peak prices in December-January, Low in March-April"
-            },
-            "export_opportunities": {
-                "wheat": "Middle East, Africa - High demand",
-                "rice": "Gulf countries, Europe - Premium prices",
-                "maize": "Southeast Asia - Growing demand",
-                "cotton": "Bangladesh, Vietnam - Textile industry",
-                "sugarcane": "Limited export opportunities",
-                "potato": "Nepal, Bangladesh - Seasonal demand"
-            },
-            "price_factors": {
-                "weather": "Drought/flood affects supply and prices",
-                "government_policy": "MSP, export restrictions impact prices",
-                "global_markets": "International prices influence local rates",
-                "demand_supply": "Festival seasons, industrial demand",
-                "transport_cost": "Fuel prices affect mandi prices",
-                "storage_availability": "Warehouse capacity affects prices"
-            }
-        }
-        
-        # Selling strategies and recommendations
-        self.selling_strategies = {
-            "immediate_sale": {
-                "crops": ["potato", "vegetables"],
-                "reason": "Perishable nature",
-                "mandi_recommendation": "Nearest mandi for freshness"
-            },
-            "staggered_sale": {
-                "crops": ["wheat", "rice"],
-                "reason": "Stable prices, storage possible",
-                "mandi_recommendation": "Multiple mandis for better prices"
-            },
-            "contract_farming": {
-                "crops": ["cotton", "sugarcane"],
-                "reason": "Assured prices, market security",
-                "mandi_recommendation": "Direct to processing units"
-            },
-            "value_addition": {
-                "crops": ["maize", "pulses"],
-                "reason": "Higher profit margins",
-                "mandi_recommendation": "Process before selling"
-            }
-        }
+    def _load_market_data(self):
+        """Bind the shared market data (prices, demand, mandis, strategies)"""
+        self.current_prices = _CURRENT_PRICES
+        self.demand_forecast = _DEMAND_FORECAST
+        self.mandi_info = _MANDI_INFO
+        self.market_trends = _MARKET_TRENDS
+        self.selling_strategies = _SELLING_STRATEGIES
     
     async def process(self, query: str, user_context: Dict, language: str = "hi") -> str:
         """Process market-related queries"""
         try:
             # Analyze query type
             query_type = self._analyze_market_query(query)
+            lang = "hi" if language == "hi" else "en"
+            
+            if query_type == "general":
+                return self._handle_general_market_query(query, user_context, lang)
             
-            if query_type == "price_inquiry":
-                return await self._handle_price_inquiry(user_context, language)
-            elif query_type == "selling_strategy":
-                return await self._handle_selling_strategy(user_context, language)
-            elif query_type == "mandi_info":
-                return await self._handle_mandi_info(user_context, language)
-            elif query_type == "demand_forecast":
-                return await self._handle_demand_forecast(user_context, language)
-            else:
-                return await self._handle_general_market_query(query, user_context, language)
+            crop_names = tuple(sorted(crop.get("name", "") for crop in user_context.get("current_crops", [])))
+            location = user_context.get("location", "Punjab")
+            return self._compute_response_cached(query_type, lang, location, crop_names)
                 
         except Exception as e:
             logger.error(f"❌ Error in Market Agent: {e}")
             return self._get_error_response(language)
     
+    def _compute_response(self, query_type: str, language: str, location: str, crop_names: tuple) -> str:
+        """Rebuild a minimal context from the hashable cache key and dispatch"""
+        context = {
+            "current_crops": [{"name": name} for name in crop_names],
+            "location": location,
+        }
+        return self._dispatch[(language, query_type)](context)
+    
     def _analyze_market_query(self, query: str) -> str:
         """Analyze the type of market query"""
         query_lower = query.lower()
-        
-        if any(word in query_lower for word in ["price", "rate", "bhav", "dum", "cost"]):
-            return "price_inquiry"
-        elif any(word in query_lower for word in ["sell", "bikri", "mandi", "market"]):
-            return "selling_strategy"
-        elif any(word in query_lower for word in ["mandi", "market", "haat"]):
-            return "mandi_info"
-        elif any(word in query_lower for word in ["demand", "trend", "future", "forecast"]):
-            return "demand_forecast"
-        else:
-            return "general"
+        matched = set()
+        for _, query_types in _QUERY_AUTOMATON.iter(query_lower):
+            matched |= query_types
+        for query_type in _QUERY_TYPE_PRIORITY:
+            if query_type in matched:
+                return query_type
+        return "general"
     
-    async def _handle_price_inquiry(self, user_context: Dict, language: str) -> str:
+    def _handle_price_inquiry(self, user_context: Dict, language: str) -> str:
         """Handle price inquiry queries"""
         current_crops = user_context.get("current_crops", [])
         
@@ -279,76 +467,35 @@ class MarketAgent:
         price_info = []
         for crop in current_crops:
             crop_name = crop.get("name", "")
-            if crop_name in self.current_prices:
-                price_data = self.current_prices[crop_name]
-                price_info.append({
-                    "crop": crop_name,
-                    "data": price_data
-                })
+            price_data = self.current_prices.get(crop_name)
+            if price_data is None:
+                continue
+            price_info.append({
+                "crop": crop_name,
+                "data": price_data
+            })
         
-        if language == "hi":
-            response = "📊 आपकी फसलों के बाजार भाव:\n\n"
-            
-            for info in price_info:
-                crop_name = info["crop"]
-                data = info["data"]
-                response += f"""🌾 {crop_name.title()}:
-💰 वर्तमान भाव: ₹{data['bathinda']:,}/क्विंटल
-📈 सर्वोच्च भाव: ₹{data['ludhiana']:,}/क्विंटल
-📉 न्यूनतम भाव: ₹{data['amritsar']:,}/क्विंटल
-📊 रुझान: {self._get_trend_text(data['trend'], 'hi')}
-🏪 सर्वोत्तम मंडी: {data['ludhiana']}
-⏰ सर्वोत्तम समय: {data['last_updated']}
-
-"""
-            
-            response += "💡 सुझाव:\n"
-            response += "• बाजार के रुझान पर नजर रखें\n"
-            response += "• सर्वोत्तम समय पर बेचें\n"
-            response += "• कई मंडियों के भाव तुलना करें"
-            
-            return response
-        else:
-            response = "📊 Market Prices for Your Crops:\n\n"
-            
-            for info in price_info:
-                crop_name = info["crop"]
-                data = info["data"]
-                response += f"""🌾 {crop_name.title()}:
-💰 Current Price: ₹{data['bathinda']:,}/quintal
-📈 Highest Price: ₹{data['ludhiana']:,}/quintal
-📉 Lowest Price: ₹{data['amritsar']:,}/quintal
-📊 Trend: {self._get_trend_text(data['trend'], 'en')}
-🏪 Best Mandi: {data['ludhiana']}
-⏰ Best Time: {data['last_updated']}
-
-"""
-            
-            response += "💡 Tips:\n"
-            response += "• Monitor market trends\n"
-            response += "• Sell at optimal time\n"
-            response += "• Compare prices across mandis"
-            
-            return response
+        tmpl = _TMPL[language]
+        parts = [tmpl["price_header"]]
+        for info in price_info:
+            data = info["data"]
+            parts.append(tmpl["price_row"].format(
+                crop=info["crop"].title(),
+                current=data["bathinda"],
+                highest=data["ludhiana"],
+                lowest=data["amritsar"],
+                trend=self._get_trend_text(data["trend"], language),
+                best_mandi=data["ludhiana"],
+                best_time=data["last_updated"]
+            ))
+        parts.append(tmpl["price_footer"])
+        return "".join(parts)
     
     def _get_trend_text(self, trend: str, language: str) -> str:
         """Get trend text in appropriate language"""
-        if language == "hi":
-            trend_map = {
-                "rising": "बढ़ रहा है",
-                "falling": "गिर रहा है",
-                "stable": "स्थिर है"
-            }
-        else:
-            trend_map = {
-                "rising": "Rising",
-                "falling": "Falling",
-                "stable": "Stable"
-            }
-        
-        return trend_map.get(trend, trend)
+        return _TREND_TABLE.get((trend, language), trend)
     
-    async def _handle_selling_strategy(self, user_context: Dict, language: str) -> str:
+    def _handle_selling_strategy(self, user_context: Dict, language: str) -> str:
         """Handle selling strategy queries"""
         current_crops = user_context.get("current_crops", [])
         location = user_context.get("location", "Punjab")
@@ -359,71 +506,38 @@ class MarketAgent:
         strategies = []
         for crop in current_crops:
             crop_name = crop.get("name", "")
-            if crop_name in self.current_prices:
+            crop_idx = _CROP_IDX.get(crop_name)
+            if crop_idx is not None:
                 price_data = self.current_prices[crop_name]
-                mandi_data = self.mandi_info.get(price_data["ludhiana"], {}) # Assuming ludhiana is the best mandi for selling strategy
                 
-                # Calculate net profit after transport and commission
-                transport_cost = mandi_data.get("transport_links", "Rail and Road").count("Rail") * 100 + mandi_data.get("transport_links", "Rail and Road").count("Road") * 50
-                commission = mandi_data.get("processing_units", 0) * 0.5 # Simplified commission
-                net_price = price_data["bathinda"] * (1 - commission/100) - transport_cost
+                best, best_net = _best_mandi(_PRICES[crop_idx], _TRANSPORT, _COMMISSION)
                 
                 strategies.append({
                     "crop": crop_name,
-                    "mandi": mandi_data["name"],
-                    "net_price": net_price,
+                    "mandi": self.mandi_info[_MANDI_NAMES[best]]["name"],
+                    "net_price": round(best_net, 2),
                     "timing": price_data["last_updated"]
                 })
         
-        if language == "hi":
-            response = "💡 आपकी फसल बिक्री रणनीति:\n\n"
-            
-            for strategy in strategies:
-                response += f"""🌾 {strategy['crop'].title()}:
-🏪 सर्वोत्तम मंडी: {strategy['mandi']}
-💰 शुद्ध भाव: ₹{strategy['net_price']:,}/क्विंटल
-⏰ सर्वोत्तम समय: {strategy['timing']}
-
-"""
-            
-            response += "📋 बिक्री के लिए सुझाव:\n"
-            response += "• फसल की गुणवत्ता बनाए रखें\n"
-            response += "• सही पैकिंग करें\n"
-            response += "• परिवहन की व्यवस्था पहले करें\n"
-            response += "• बैंक गारंटी लें"
-            
-            return response
-        else:
-            response = "💡 Selling Strategy for Your Crops:\n\n"
-            
-            for strategy in strategies:
-                response += f"""🌾 {strategy['crop'].title()}:
-🏪 Best Mandi: {strategy['mandi']}
-💰 Net Price: ₹{strategy['net_price']:,}/quintal
-⏰ Best Time: {strategy['timing']}
-
-"""
-            
-            response += "📋 Selling Tips:\n"
-            response += "• Maintain crop quality\n"
-            response += "• Proper packaging\n"
-            response += "• Arrange transport in advance\n"
-            response += "• Get bank guarantee"
-            
-            return response
+        tmpl = _TMPL[language]
+        parts = [tmpl["strategy_header"]]
+        for strategy in strategies:
+            parts.append(tmpl["strategy_row"].format(
+                crop=strategy["crop"].title(),
+                mandi=strategy["mandi"],
+                net_price=strategy["net_price"],
+                timing=strategy["timing"]
+            ))
+        parts.append(tmpl["strategy_footer"])
+        return "".join(parts)
     
-    async def _handle_mandi_info(self, user_context: Dict, language: str) -> str:
+    def _handle_mandi_info(self, user_context: Dict, language: str) -> str:
         """Handle mandi information queries"""
         location = user_context.get("location", "Punjab")
         
-        # Get nearby mandis
-        nearby_mandis = []
-        for mandi_name, mandi_data in self.mandi_info.items():
-            if mandi_data["location"].startswith(location):
-                nearby_mandis.append({
-                    "name": mandi_data["name"],
-                    "data": mandi_data
-                })
+        # Get nearby mandis, falling back to the Punjab list when the
+        # location is not a known state
+        nearby_mandis = _MANDIS_BY_STATE.get(location) or _MANDIS_BY_STATE["Punjab"]
         
         if language == "hi":
             response = f"🏪 {location} के निकटवर्ती मंडी:\n\n"
@@ -432,8 +546,8 @@ class MarketAgent:
                 data = mandi["data"]
                 response += f"""🏪 {mandi['name']}:
 🌾 विशेषज्ञता: {data['specialization']}
-🚚 परिवहन लागत: ₹{data['transport_links'].count('Rail') * 100 + data['transport_links'].count('Road') * 50:,}
-💼 कमीशन: {data['processing_units'] * 0.5}%
+🚚 परिवहन लागत: ₹{data['transport_cost']:,}
+💼 कमीशन: {data['commission_pct']}%
 
 """
             
@@ -450,8 +564,8 @@ class MarketAgent:
                 data = mandi["data"]
                 response += f"""🏪 {mandi['name']}:
 🌾 Specialization: {data['specialization']}
-🚚 Transport Cost: ₹{data['transport_links'].count('Rail') * 100 + data['transport_links'].count('Road') * 50:,}
-💼 Commission: {data['processing_units'] * 0.5}%
+🚚 Transport Cost: ₹{data['transport_cost']:,}
+💼 Commission: {data['commission_pct']}%
 
 """
             
@@ -462,7 +576,7 @@ class MarketAgent:
             
             return response
     
-    async def _handle_demand_forecast(self, user_context: Dict, language: str) -> str:
+    def _handle_demand_forecast(self, user_context: Dict, language: str) -> str:
         """Handle demand forecasting queries"""
         current_crops = user_context.get("current_crops", [])
         
@@ -472,13 +586,14 @@ class MarketAgent:
         forecasts = []
         for crop in current_crops:
             crop_name = crop.get("name", "")
-            if crop_name in self.demand_forecast:
-                forecast_data = self.demand_forecast[crop_name]
-                forecasts.append({
-                    "crop": crop_name,
-                    "trend": forecast_data["next_6_months"],
-                    "reason": forecast_data["reason"]
-                })
+            forecast_data = self.demand_forecast.get(crop_name)
+            if forecast_data is None:
+                continue
+            forecasts.append({
+                "crop": crop_name,
+                "trend": forecast_data["next_6_months"],
+                "reason": forecast_data["reason"]
+            })
         
         if language == "hi":
             response = "🔮 आपकी फसलों की मांग पूर्वानुमान:\n\n"
@@ -513,7 +628,7 @@ class MarketAgent:
             
             return response
     
-    async def _handle_general_market_query(self, query: str, user_context: Dict, language: str) -> str:
+    def _handle_general_market_query(self, query: str, user_context: Dict, language: str) -> str:
         """Handle general market queries"""
         if language == "hi":
             return """📊 बाजार सलाह:
@@ -551,21 +666,30 @@ Do you want crop prices, selling strategy, or mandi information?"""
             return "Sorry, there's an issue providing market information. Please try again later."
     
     async def get_market_insights(self, crop_name: str, location: str) -> Dict[str, Any]:
-        """Get detailed market insights for a specific crop and location"""
-        price_data = self.current_prices.get(crop_name, {})
-        demand_data = self.demand_forecast.get(crop_name, {})
-        
-        return {
-            "crop": crop_name,
-            "location": location,
-            "current_price": price_data.get("bathinda", 0),
-            "price_trend": price_data.get("trend", "stable"),
-            "demand_trend": demand_data.get("next_6_months", "stable"),
-            "best_mandi": price_data.get("ludhiana", ""),
-            "best_time": price_data.get("last_updated", ""),
-            "recommendations": [
-                f"Monitor {crop_name} prices regularly",
-                f"Consider selling at {price_data.get('last_updated', 'optimal time')}",
-                f"Check prices at {price_data.get('ludhiana', 'nearby mandis')}"
-            ]
-        }
+        """Get detailed market insights for a specific crop and location.
+
+        Built purely from the static module data, so results come from a
+        shared cache; callers must treat the returned dict as read-only.
+        The method stays async because the orchestrator awaits it.
+        """
+        return _insights(crop_name, location)
+
+@functools.lru_cache(maxsize=256)
+def _insights(crop_name: str, location: str) -> Dict[str, Any]:
+    price_data = _CURRENT_PRICES.get(crop_name, {})
+    demand_data = _DEMAND_FORECAST.get(crop_name, {})
+
+    return {
+        "crop": crop_name,
+        "location": location,
+        "current_price": price_data.get("bathinda", 0),
+        "price_trend": price_data.get("trend", "stable"),
+        "demand_trend": demand_data.get("next_6_months", "stable"),
+        "best_mandi": price_data.get("ludhiana", ""),
+        "best_time": price_data.get("last_updated", ""),
+        "recommendations": [
+            f"Monitor {crop_name} prices regularly",
+            f"Consider selling at {price_data.get('last_updated', 'optimal time')}",
+            f"Check prices at {price_data.get('ludhiana', 'nearby mandis')}"
+        ]
+    }
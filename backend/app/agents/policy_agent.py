@@ -1,413 +1,179 @@
-import asyncio
-import json
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+import bisect
+import functools
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Any
+import ahocorasick
+import numpy as np
+import orjson
 from loguru import logger
-from app.core.config import settings
 
-class PolicyAgent:
+@dataclass(slots=True, frozen=True)
+class Scheme:
+    """Immutable view of one government scheme with its pre-rendered blocks."""
+    id: str
+    name: str
+    amount: Any
+    frequency: str
+    eligibility: str
+    land_limit: float
+    status: str
+    render_hi: str
+    render_en: str
+    render_subsidy_hi: str
+    render_subsidy_en: str
+
+@dataclass(slots=True, frozen=True)
+class SchemeBrief:
+    """Summary of one recommended scheme; orjson serializes it natively."""
+    scheme_id: str
+    name: str
+    amount: Any
+    eligibility: str
+
+@dataclass(slots=True, frozen=True)
+class SchemeRecommendations:
+    """Recommendation payload returned by get_scheme_recommendations."""
+    user_id: str
+    recommended_schemes: tuple
+    total_benefit: int
+
+# Keyword sets for query-type classification, compiled below into an
+# Aho-Corasick automaton so a query is scanned once for every keyword.
+_TYPE_KEYWORDS = {
+    "scheme_info": frozenset({"scheme", "yojana", "program"}),
+    "eligibility_check": frozenset({"eligible", "qualify", "check"}),
+    "application_help": frozenset({"apply", "application", "form"}),
+    "subsidy_info": frozenset({"subsidy", "help", "support"}),
+}
+
+# Same precedence as the old if/elif chain
+_QUERY_TYPE_PRIORITY = ("scheme_info", "eligibility_check", "application_help", "subsidy_info")
+
+# Default land limit for schemes without one: no upper bound
+_INF = float("inf")
+
+# Exact keyword -> query type, honouring the priority order, so a query
+# that is just one keyword resolves with a single dict lookup
+_KEYWORD_EXACT: Dict[str, str] = {}
+for _query_type in reversed(_QUERY_TYPE_PRIORITY):
+    for _keyword in _TYPE_KEYWORDS[_query_type]:
+        _KEYWORD_EXACT[_keyword] = _query_type
+del _query_type, _keyword
+
+def _build_query_automaton() -> "ahocorasick.Automaton":
+    """Compile the keyword tables into a single Aho-Corasick automaton.
+
+    Keywords shared by several query types carry the full set of types
+    they indicate, so one pass over the query collects every match.
     """
-    Policy Agent - Handles government schemes, subsidies, and policy information
-    for Indian farmers.
+    keyword_types: Dict[str, set] = {}
+    for query_type, keywords in _TYPE_KEYWORDS.items():
+        for keyword in keywords:
+            keyword_types.setdefault(keyword, set()).add(query_type)
+
+    automaton = ahocorasick.Automaton()
+    for keyword, types in keyword_types.items():
+        automaton.add_word(keyword, frozenset(types))
+    automaton.make_automaton()
+    return automaton
+
+_QUERY_AUTOMATON = _build_query_automaton()
+
+def _intern_strings(obj):
+    """Recursively intern every string in a parsed JSON structure.
+
+    Repeated contact numbers, portal URLs and document names across the
+    policy tables then reference one object each.
     """
-    
-    def __init__(self):
-        self.name = "Policy Agent"
-        self.description = "Specialized in government schemes, subsidies, and policy guidance"
-        self.initialized = False
-        
-    async def initialize(self):
-        """Initialize the policy agent with scheme and subsidy data"""
-        try:
-            await self._load_policy_data()
-            self.initialized = True
-            logger.info("🏛️ Policy Agent initialized successfully")
-        except Exception as e:
-            logger.error(f"❌ Error initializing Policy Agent: {e}")
-            raise
-    
-    async def _load_policy_data(self):
-        """Load government schemes, subsidies, and policy data"""
-        # Comprehensive government schemes for Punjab farmers
-        self.government_schemes = {
-            "pm_kisan": {
-                "name": "PM-KISAN (Pradhan Mantri Kisan Samman Nidhi)",
-                "amount": 6000,
-                "frequency": "yearly",
-                "eligibility": "Small and marginal farmers (up to 2 hectares)",
-                "application": "Online through PM-KISAN portal",
-                "disbursement": "Quarterly installments of ₹2000",
-                "deadline": "Ongoing",
-                "contact": "1800-180-1551",
-                "website": "pmkisan.gov.in",
-                "documents_required": ["Aadhaar", "Land records", "Bank account"]
-            },
-            "pm_fasal_bima_yojana": {
-                "name": "PM Fasal Bima Yojana (Crop Insurance)",
-                "amount": "Up to 100% of sum insured",
-                "frequency": "per_crop_season",
-                "eligibility": "All farmers growing notified crops",
-                "application": "Through banks or insurance companies",
-                "disbursement": "Within 10 days of loss assessment",
-                "deadline": "Before sowing",
-                "contact": "1800-180-1551",
-                "website": "pmfby.gov.in",
-                "documents_required": ["Land records", "Crop details", "Bank account"]
-            },
-            "kisan_credit_card": {
-                "name": "Kisan Credit Card (KCC)",
-                "amount": "Up to ₹3 lakhs",
-                "frequency": "renewable",
-                "eligibility": "All farmers including tenant farmers",
-                "application": "Through banks",
-                "disbursement": "Within 7 days",
-                "deadline": "Anytime",
-                "contact": "Local bank branches",
-                "website": "nccf.in",
-                "documents_required": ["Aadhaar", "Land records", "Income certificate"]
-            },
-            "pm_ksy": {
-                "name": "PM Kisan Sampada Yojana (Food Processing)",
-                "amount": "Up to ₹10 crores",
-                "frequency": "one_time",
-                "eligibility": "Food processing units and farmers",
-                "application": "Through Ministry of Food Processing",
-                "disbursement": "After project approval",
-                "deadline": "31st March 2025",
-                "contact": "011-26492200",
-                "website": "mofpi.gov.in",
-                "documents_required": ["Project proposal", "Land documents", "Financial statements"]
-            },
-            "pm_ksn": {
-                "name": "PM Kisan Suryodaya Yojana (Solar Pumps)",
-                "amount": "Up to ₹1.5 lakhs",
-                "frequency": "one_time",
-                "eligibility": "Farmers with 2+ acres",
-                "application": "Through agriculture department",
-                "disbursement": "After installation",
-                "deadline": "31st December 2024",
-                "contact": "1800-180-1551",
-                "website": "pmksy.gov.in",
-                "documents_required": ["Land records", "Electricity connection", "Bank account"]
-            },
-            "pm_ksy_horticulture": {
-                "name": "PM Kisan Sampada Yojana - Horticulture",
-                "amount": "Up to ₹50 lakhs",
-                "frequency": "one_time",
-                "eligibility": "Horticulture farmers",
-                "application": "Through horticulture department",
-                "disbursement": "After project completion",
-                "deadline": "31st March 2025",
-                "contact": "011-23382642",
-                "website": "nhb.gov.in",
-                "documents_required": ["Project proposal", "Land documents", "Technical feasibility"]
-            }
-        }
-        
-        # Punjab-specific subsidy schemes
-        self.punjab_subsidies = {
-            "seed_subsidy": {
-                "name": "Seed Subsidy Scheme",
-                "amount": 500,
-                "frequency": "per_quintal",
-                "eligibility": "Small and marginal farmers",
-                "application": "Through agriculture department",
-                "disbursement": "Subsidized seed distribution",
-                "deadline": "Before sowing season",
-                "contact": "0172-2700711",
-                "website": "punjab.gov.in/agriculture",
-                "documents_required": ["Land records", "Farmer ID", "Seed requirement"]
-            },
-            "fertilizer_subsidy": {
-                "name": "Fertilizer Subsidy",
-                "amount": 1400,
-                "frequency": "per_bag",
-                "eligibility": "All farmers",
-                "application": "Through authorized dealers",
-                "disbursement": "Direct benefit transfer",
-                "deadline": "Ongoing",
-                "contact": "1800-180-1551",
-                "website": "fertilizer.gov.in",
-                "documents_required": ["Aadhaar", "Land records", "Bank account"]
-            },
-            "pesticide_subsidy": {
-                "name": "Pesticide Subsidy",
-                "amount": 300,
-                "frequency": "per_liter",
-                "eligibility": "All farmers",
-                "application": "Through authorized centers",
-                "disbursement": "Subsidized pesticide distribution",
-                "deadline": "Before pest attack",
-                "contact": "0172-2700711",
-                "website": "punjab.gov.in/agriculture",
-                "documents_required": ["Land records", "Crop details", "Pest identification"]
-            },
-            "drip_irrigation_subsidy": {
-                "name": "Drip Irrigation Subsidy",
-                "amount": 50000,
-                "frequency": "one_time",
-                "eligibility": "Farmers with 2+ acres",
-                "application": "Through agriculture department",
-                "disbursement": "After installation verification",
-                "deadline": "31st March 2025",
-                "contact": "0172-2700711",
-                "website": "punjab.gov.in/agriculture",
-                "documents_required": ["Land records", "Water source", "Technical approval"]
-            },
-            "farm_machinery_subsidy": {
-                "name": "Farm Machinery Subsidy",
-                "amount": "Up to 40% of cost",
-                "frequency": "one_time",
-                "eligibility": "Farmers with 5+ acres",
-                "application": "Through agriculture department",
-                "disbursement": "After purchase verification",
-                "deadline": "31st March 2025",
-                "contact": "0172-2700711",
-                "website": "punjab.gov.in/agriculture",
-                "documents_required": ["Land records", "Machine quotation", "Bank loan approval"]
-            }
-        }
-        
-        # Loan policies and interest rates
-        self.loan_policies = {
-            "crop_loan": {
-                "interest_rate": 7.0,
-                "max_amount": 300000,
-                "tenure": 12,
-                "processing_fee": 0.5,
-                "collateral": "Crop hypothecation",
-                "eligibility": "All farmers with land ownership",
-                "repayment": "After harvest",
-                "subsidy": "Interest subvention of 2% for timely repayment"
-            },
-            "term_loan": {
-                "interest_rate": 8.5,
-                "max_amount": 1000000,
-                "tenure": 60,
-                "processing_fee": 1.0,
-                "collateral": "Land mortgage",
-                "eligibility": "Farmers with 5+ years experience",
-                "repayment": "Monthly installments",
-                "subsidy": "Interest subvention of 1.5% for women farmers"
-            },
-            "dairy_loan": {
-                "interest_rate": 6.5,
-                "max_amount": 500000,
-                "tenure": 36,
-                "processing_fee": 0.75,
-                "collateral": "Livestock hypothecation",
-                "eligibility": "Farmers with dairy experience",
-                "repayment": "Monthly installments",
-                "subsidy": "Interest subvention of 2% for small farmers"
-            },
-            "horticulture_loan": {
-                "interest_rate": 6.8,
-                "max_amount": 400000,
-                "tenure": 48,
-                "processing_fee": 0.8,
-                "collateral": "Crop and land",
-                "eligibility": "Farmers with horticulture training",
-                "repayment": "After harvest",
-                "subsidy": "Interest subvention of 1.5% for organic farming"
-            }
-        }
-        
-        # Application centers and support
-        self.application_centers = {
-            "agriculture_department": {
-                "name": "Agriculture Department Office",
-                "services": ["PM-KISAN", "Seed subsidy", "Crop insurance", "Drip irrigation"],
-                "contact": "0172-2700711",
-                "address": "Sector 17, Chandigarh",
-                "working_hours": "9:00 AM - 5:00 PM",
-                "online_services": True
-            },
-            "bank_branch": {
-                "name": "Bank Branch",
-                "services": ["PM-KISAN", "Crop loans", "KCC", "Insurance"],
-                "contact": "Varies by bank",
-                "address": "Local bank branches",
-                "working_hours": "10:00 AM - 4:00 PM",
-                "online_services": True
-            },
-            "common_service_center": {
-                "name": "Common Service Center (CSC)",
-                "services": ["All schemes", "Online applications", "Document verification"],
-                "contact": "1800-3000-3468",
-                "address": "Village panchayats",
-                "working_hours": "8:00 AM - 8:00 PM",
-                "online_services": True
-            },
-            "krishi_vigyan_kendra": {
-                "name": "Krishi Vigyan Kendra",
-                "services": ["Technical guidance", "Training programs", "Scheme information"],
-                "contact": "0172-2700711",
-                "address": "District headquarters",
-                "working_hours": "9:00 AM - 6:00 PM",
-                "online_services": False
-            }
-        }
-    
-    async def process(self, query: str, user_context: Dict, language: str = "hi") -> str:
-        """Process policy-related queries"""
-        try:
-            # Analyze query type
-            query_type = self._analyze_policy_query(query)
-            
-            if query_type == "scheme_info":
-                return await self._handle_scheme_info(user_context, language)
-            elif query_type == "eligibility_check":
-                return await self._handle_eligibility_check(user_context, language)
-            elif query_type == "application_help":
-                return await self._handle_application_help(user_context, language)
-            elif query_type == "subsidy_info":
-                return await self._handle_subsidy_info(user_context, language)
-            else:
-                return await self._handle_general_policy_query(query, user_context, language)
-                
-        except Exception as e:
-            logger.error(f"❌ Error in Policy Agent: {e}")
-            return self._get_error_response(language)
-    
-    def _analyze_policy_query(self, query: str) -> str:
-        """Analyze the type of policy query"""
-        query_lower = query.lower()
-        
-        if any(word in query_lower for word in ["scheme", "yojana", "program"]):
-            return "scheme_info"
-        elif any(word in query_lower for word in ["eligible", "qualify", "check"]):
-            return "eligibility_check"
-        elif any(word in query_lower for word in ["apply", "application", "form"]):
-            return "application_help"
-        elif any(word in query_lower for word in ["subsidy", "help", "support"]):
-            return "subsidy_info"
-        else:
-            return "general"
-    
-    async def _handle_scheme_info(self, user_context: Dict, language: str) -> str:
-        """Handle scheme information queries"""
-        land_area = user_context.get("land_area", 0)
-        location = user_context.get("location", "Punjab")
-        
-        # Get relevant schemes based on user profile
-        relevant_schemes = []
-        
-        for scheme_id, scheme_data in self.government_schemes.items():
-            if scheme_data["status"] == "active":
-                # Check eligibility based on land area
-                land_limit = scheme_data.get("land_limit", float('inf'))
-                if land_area <= land_limit:
-                    relevant_schemes.append({
-                        "id": scheme_id,
-                        "data": scheme_data
-                    })
-        
-        # Add state-specific schemes
-        state_schemes = self.state_schemes.get(location, {})
-        for scheme_id, scheme_data in state_schemes.items():
-            relevant_schemes.append({
-                "id": scheme_id,
-                "data": scheme_data
-            })
-        
-        if language == "hi":
-            response = f"🏛️ आपके लिए उपलब्ध सरकारी योजनाएं:\n\n"
-            
-            for scheme in relevant_schemes[:5]:  # Show top 5 schemes
-                data = scheme["data"]
-                response += f"""📋 {data['name']}:
-💰 राशि: {data.get('amount', 'Variable')}
-📅 आवृत्ति: {data.get('frequency', 'One-time')}
-✅ पात्रता: {', '.join(data.get('eligibility', ['All farmers']))}
-📝 विवरण: {data.get('description', 'No description available')}
-
-"""
-            
-            response += "📞 आवेदन के लिए संपर्क करें:\n"
-            response += "• कृषि विभाग कार्यालय\n"
-            response += "• बैंक शाखा\n"
-            response += "• कॉमन सर्विस सेंटर (CSC)\n"
-            response += "• ऑनलाइन पोर्टल"
-            
-            return response
-        else:
-            response = f"🏛️ Government Schemes Available for You:\n\n"
-            
-            for scheme in relevant_schemes[:5]:  # Show top 5 schemes
-                data = scheme["data"]
-                response += f"""📋 {data['name']}:
-💰 Amount: {data.get('amount', 'Variable')}
-📅 Frequency: {data.get('frequency', 'One-time')}
-✅ Eligibility: {', '.join(data.get('eligibility', ['All farmers']))}
-📝 Description: {data.get('description', 'No description available')}
-
-"""
-            
-            response += "📞 To Apply Contact:\n"
-            response += "• Agriculture Department Office\n"
-            response += "• Bank Branch\n"
-            response += "• Common Service Center (CSC)\n"
-            response += "• Online Portal"
-            
-            return response
-    
-    async def _handle_eligibility_check(self, user_context: Dict, language: str) -> str:
-        """Handle eligibility check queries"""
-        land_area = user_context.get("land_area", 0)
-        location = user_context.get("location", "Punjab")
-        
-        eligibility_results = []
-        
-        for scheme_id, scheme_data in self.schemes.items():
-            if scheme_data["status"] == "active":
-                land_limit = scheme_data.get("land_limit", float('inf'))
-                is_eligible = land_area <= land_limit
-                
-                eligibility_results.append({
-                    "scheme": scheme_data["name"],
-                    "eligible": is_eligible,
-                    "reason": f"Land area: {land_area} acres" if is_eligible else f"Land limit: {land_limit} hectares"
-                })
-        
-        if language == "hi":
-            response = "✅ आपकी योजना पात्रता जांच:\n\n"
-            
-            for result in eligibility_results:
-                status = "✅ पात्र" if result["eligible"] else "❌ अपात्र"
-                response += f"""📋 {result['scheme']}:
-{status}
-📝 कारण: {result['reason']}
-
-"""
-            
-            response += "💡 सुझाव:\n"
-            response += "• पात्र योजनाओं के लिए आवेदन करें\n"
-            response += "• आवश्यक दस्तावेज तैयार रखें\n"
-            response += "• नियमित अपडेट जांचें"
-            
-            return response
-        else:
-            response = "✅ Your Scheme Eligibility Check:\n\n"
-            
-            for result in eligibility_results:
-                status = "✅ Eligible" if result["eligible"] else "❌ Not Eligible"
-                response += f"""📋 {result['scheme']}:
-{status}
-📝 Reason: {result['reason']}
-
-"""
-            
-            response += "💡 Tips:\n"
-            response += "• Apply for eligible schemes\n"
-            response += "• Keep required documents ready\n"
-            response += "• Check for regular updates"
-            
-            return response
-    
-    async def _handle_application_help(self, user_context: Dict, language: str) -> str:
-        """Handle application help queries"""
-        if language == "hi":
-            return """📝 योजना आवेदन में सहायता:
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, list):
+        return [_intern_strings(item) for item in obj]
+    if isinstance(obj, dict):
+        return {sys.intern(key): _intern_strings(value) for key, value in obj.items()}
+    return obj
+
+# Policy datasets live beside the module and are parsed once at import
+_POLICY_DATA = _intern_strings(
+    orjson.loads((Path(__file__).parent / "data" / "policy_data.json").read_bytes())
+)
+_GOVERNMENT_SCHEMES = MappingProxyType(_POLICY_DATA["government_schemes"])
+_PUNJAB_SUBSIDIES = MappingProxyType(_POLICY_DATA["punjab_subsidies"])
+_LOAN_POLICIES = MappingProxyType(_POLICY_DATA["loan_policies"])
+_APPLICATION_CENTERS = MappingProxyType(_POLICY_DATA["application_centers"])
+
+# Static header/footer fragments for the response builders, keyed by language
+_SCHEME_HEADER = {
+    "hi": "🏛️ आपके लिए उपलब्ध सरकारी योजनाएं:\n\n",
+    "en": "🏛️ Government Schemes Available for You:\n\n",
+}
+
+_SCHEME_FOOTER = {
+    "hi": (
+        "📞 आवेदन के लिए संपर्क करें:\n"
+        "• कृषि विभाग कार्यालय\n"
+        "• बैंक शाखा\n"
+        "• कॉमन सर्विस सेंटर (CSC)\n"
+        "• ऑनलाइन पोर्टल"
+    ),
+    "en": (
+        "📞 To Apply Contact:\n"
+        "• Agriculture Department Office\n"
+        "• Bank Branch\n"
+        "• Common Service Center (CSC)\n"
+        "• Online Portal"
+    ),
+}
+
+_ELIGIBILITY_HEADER = {
+    "hi": "✅ आपकी योजना पात्रता जांच:\n\n",
+    "en": "✅ Your Scheme Eligibility Check:\n\n",
+}
+
+_ELIGIBILITY_FOOTER = {
+    "hi": (
+        "💡 सुझाव:\n"
+        "• पात्र योजनाओं के लिए आवेदन करें\n"
+        "• आवश्यक दस्तावेज तैयार रखें\n"
+        "• नियमित अपडेट जांचें"
+    ),
+    "en": (
+        "💡 Tips:\n"
+        "• Apply for eligible schemes\n"
+        "• Keep required documents ready\n"
+        "• Check for regular updates"
+    ),
+}
+
+_SUBSIDY_HEADER = {
+    "hi": "💰 आपके लिए उपलब्ध सब्सिडी:\n\n",
+    "en": "💰 Subsidies Available for You:\n\n",
+}
+
+_SUBSIDY_FOOTER = {
+    "hi": (
+        "💡 सब्सिडी के लाभ:\n"
+        "• कृषि लागत कम होती है\n"
+        "• लाभ बढ़ता है\n"
+        "• जोखिम कम होता है\n"
+        "• आधुनिक तकनीक अपनाने में मदद"
+    ),
+    "en": (
+        "💡 Benefits of Subsidies:\n"
+        "• Reduces agricultural costs\n"
+        "• Increases profits\n"
+        "• Reduces risk\n"
+        "• Helps adopt modern technology"
+    ),
+}
+
+# Fully static responses served straight from a table keyed by
+# (query type, language), bypassing handler dispatch entirely
+_STATIC_RESPONSES = {
+    ("application_help", "hi"): """📝 योजना आवेदन में सहायता:
 
 📋 आवश्यक दस्तावेज:
 • आधार कार्ड
@@ -429,9 +195,8 @@ class PolicyAgent:
 4. आवेदन संख्या नोट करें
 5. स्थिति जांचें
 
-📞 हेल्पलाइन: 1800-180-1551"""
-        else:
-            return """📝 Scheme Application Help:
+📞 हेल्पलाइन: 1800-180-1551""",
+    ("application_help", "en"): """📝 Scheme Application Help:
 
 📋 Required Documents:
 • Aadhaar Card
@@ -453,67 +218,8 @@ class PolicyAgent:
 4. Note application number
 5. Check status
 
-📞 Helpline: 1800-180-1551"""
-    
-    async def _handle_subsidy_info(self, user_context: Dict, language: str) -> str:
-        """Handle subsidy information queries"""
-        current_crops = user_context.get("current_crops", [])
-        
-        relevant_subsidies = []
-        
-        # Get subsidies relevant to user's crops
-        for scheme_id, scheme_data in self.schemes.items():
-            if "subsidy" in scheme_id.lower() or "fertilizer" in scheme_id.lower() or "seed" in scheme_id.lower():
-                relevant_subsidies.append({
-                    "id": scheme_id,
-                    "data": scheme_data
-                })
-        
-        if language == "hi":
-            response = "💰 आपके लिए उपलब्ध सब्सिडी:\n\n"
-            
-            for subsidy in relevant_subsidies:
-                data = subsidy["data"]
-                response += f"""💰 {data['name']}:
-💵 राशि: {data.get('amount', 'Variable')}
-📅 आवृत्ति: {data.get('frequency', 'One-time')}
-✅ पात्रता: {', '.join(data.get('eligibility', ['All farmers']))}
-📝 विवरण: {data.get('description', 'No description available')}
-
-"""
-            
-            response += "💡 सब्सिडी के लाभ:\n"
-            response += "• कृषि लागत कम होती है\n"
-            response += "• लाभ बढ़ता है\n"
-            response += "• जोखिम कम होता है\n"
-            response += "• आधुनिक तकनीक अपनाने में मदद"
-            
-            return response
-        else:
-            response = "💰 Subsidies Available for You:\n\n"
-            
-            for subsidy in relevant_subsidies:
-                data = subsidy["data"]
-                response += f"""💰 {data['name']}:
-💵 Amount: {data.get('amount', 'Variable')}
-📅 Frequency: {data.get('frequency', 'One-time')}
-✅ Eligibility: {', '.join(data.get('eligibility', ['All farmers']))}
-📝 Description: {data.get('description', 'No description available')}
-
-"""
-            
-            response += "💡 Benefits of Subsidies:\n"
-            response += "• Reduces agricultural costs\n"
-            response += "• Increases profits\n"
-            response += "• Reduces risk\n"
-            response += "• Helps adopt modern technology"
-            
-            return response
-    
-    async def _handle_general_policy_query(self, query: str, user_context: Dict, language: str) -> str:
-        """Handle general policy queries"""
-        if language == "hi":
-            return """🏛️ सरकारी योजना सलाह:
+📞 Helpline: 1800-180-1551""",
+    ("general", "hi"): """🏛️ सरकारी योजना सलाह:
 
 • नियमित रूप से नई योजनाएं जांचें
 • पात्रता मापदंड समझें
@@ -521,9 +227,8 @@ class PolicyAgent:
 • समय पर आवेदन करें
 • आवेदन स्थिति जांचें
 
-क्या आप किसी विशेष योजना, सब्सिडी या आवेदन प्रक्रिया के बारे में जानना चाहते हैं?"""
-        else:
-            return """🏛️ Government Scheme Advice:
+क्या आप किसी विशेष योजना, सब्सिडी या आवेदन प्रक्रिया के बारे में जानना चाहते हैं?""",
+    ("general", "en"): """🏛️ Government Scheme Advice:
 
 • Check for new schemes regularly
 • Understand eligibility criteria
@@ -531,7 +236,263 @@ class PolicyAgent:
 • Apply on time
 • Check application status
 
-Do you want to know about specific schemes, subsidies, or application process?"""
+Do you want to know about specific schemes, subsidies, or application process?""",
+}
+
+def _schemes_from(table) -> List[Scheme]:
+    """Build active Scheme records from a parsed scheme table."""
+    return [
+        Scheme(
+            id=scheme_id,
+            name=scheme_data["name"],
+            amount=scheme_data.get("amount", "Variable"),
+            frequency=scheme_data.get("frequency", "One-time"),
+            eligibility=scheme_data.get("eligibility", "All farmers"),
+            land_limit=scheme_data.get("land_limit", _INF),
+            status=scheme_data.get("status", "active"),
+            render_hi=scheme_data["_render_hi"],
+            render_en=scheme_data["_render_en"],
+            render_subsidy_hi=scheme_data["_render_subsidy_hi"],
+            render_subsidy_en=scheme_data["_render_subsidy_en"],
+        )
+        for scheme_id, scheme_data in table.items()
+        if scheme_data.get("status", "active") == "active"
+    ]
+
+class PolicyAgent:
+    """
+    Policy Agent - Handles government schemes, subsidies, and policy information
+    for Indian farmers.
+    """
+
+    # Instance state is just identity plus the per-instance response
+    # cache; the shared data structures live on the class and are
+    # deliberately not slotted.
+    __slots__ = ("name", "description", "initialized", "_compute_response_cached")
+
+    # Set once the shared class-level data structures have been built
+    _data_loaded = False
+
+    def __init__(self):
+        self.name = "Policy Agent"
+        self.description = "Specialized in government schemes, subsidies, and policy guidance"
+        self.initialized = False
+        # Per-instance response cache keyed on the context projection the
+        # handlers actually read (query type, language, land area, location).
+        self._compute_response_cached = functools.lru_cache(maxsize=2048)(self._compute_response)
+        
+    async def initialize(self):
+        """Initialize the policy agent with scheme and subsidy data"""
+        try:
+            self._load_policy_data()
+            self.initialized = True
+            logger.info("🏛️ Policy Agent initialized successfully")
+        except Exception as e:
+            logger.error(f"❌ Error initializing Policy Agent: {e}")
+            raise
+    
+    @classmethod
+    def _load_policy_data(cls):
+        """Load government schemes, subsidies, and policy data.
+
+        The parsed tables and every derived structure live on the class,
+        so all agent instances share one copy and repeat initialization
+        is a no-op.
+        """
+        if cls._data_loaded:
+            return
+
+        # Datasets are parsed from data/policy_data.json at import time;
+        # the class just binds the shared read-only views.
+        cls.government_schemes = _GOVERNMENT_SCHEMES
+        cls.punjab_subsidies = _PUNJAB_SUBSIDIES
+        cls.loan_policies = _LOAN_POLICIES
+        cls.application_centers = _APPLICATION_CENTERS
+
+        # Pre-render the per-scheme response blocks once so the handlers
+        # only concatenate strings.  Eligibility is stored as a plain
+        # string and is rendered as-is (the old handlers joined it
+        # character by character).
+        for scheme_data in (*cls.government_schemes.values(), *cls.punjab_subsidies.values()):
+            name = scheme_data["name"]
+            amount = scheme_data.get("amount", "Variable")
+            frequency = scheme_data.get("frequency", "One-time")
+            eligibility = scheme_data.get("eligibility", "All farmers")
+            description = scheme_data.get("description", "No description available")
+            scheme_data["_render_hi"] = (
+                f"📋 {name}:\n💰 राशि: {amount}\n📅 आवृत्ति: {frequency}\n"
+                f"✅ पात्रता: {eligibility}\n📝 विवरण: {description}\n\n"
+            )
+            scheme_data["_render_en"] = (
+                f"📋 {name}:\n💰 Amount: {amount}\n📅 Frequency: {frequency}\n"
+                f"✅ Eligibility: {eligibility}\n📝 Description: {description}\n\n"
+            )
+            scheme_data["_render_subsidy_hi"] = (
+                f"💰 {name}:\n💵 राशि: {amount}\n📅 आवृत्ति: {frequency}\n"
+                f"✅ पात्रता: {eligibility}\n📝 विवरण: {description}\n\n"
+            )
+            scheme_data["_render_subsidy_en"] = (
+                f"💰 {name}:\n💵 Amount: {amount}\n📅 Frequency: {frequency}\n"
+                f"✅ Eligibility: {eligibility}\n📝 Description: {description}\n\n"
+            )
+
+        # Active schemes as immutable Scheme records sorted by land limit,
+        # with parallel limits structures so land-area eligibility is a
+        # bisect (or one vectorized compare) instead of a full scan.
+        cls._active_schemes = sorted(
+            _schemes_from(cls.government_schemes), key=lambda scheme: scheme.land_limit
+        )
+        cls._limits = [scheme.land_limit for scheme in cls._active_schemes]
+        cls._land_limits_np = np.fromiter(cls._limits, dtype=np.float32, count=len(cls._limits))
+        cls._land_limits_np.setflags(write=False)
+
+        # Eligibility blocks precomputed per scheme: the eligible variant
+        # keeps a {reason} slot for the caller's land area, the ineligible
+        # variant is fully static.
+        cls._elig_yes = {"hi": [], "en": []}
+        cls._elig_no = {"hi": [], "en": []}
+        for scheme in cls._active_schemes:
+            no_reason = f"Land limit: {scheme.land_limit} hectares"
+            cls._elig_yes["hi"].append(f"📋 {scheme.name}:\n✅ पात्र\n📝 कारण: {{reason}}\n\n")
+            cls._elig_no["hi"].append(f"📋 {scheme.name}:\n❌ अपात्र\n📝 कारण: {no_reason}\n\n")
+            cls._elig_yes["en"].append(f"📋 {scheme.name}:\n✅ Eligible\n📝 Reason: {{reason}}\n\n")
+            cls._elig_no["en"].append(f"📋 {scheme.name}:\n❌ Not Eligible\n📝 Reason: {no_reason}\n\n")
+
+        # Punjab subsidies as Scheme records: surfaced through the
+        # state-specific pool in scheme listings and merged into the
+        # subsidy pool below
+        punjab_pool = _schemes_from(cls.punjab_subsidies)
+        cls.state_schemes = {"Punjab": punjab_pool}
+
+        # Subsidy-oriented schemes, selected once by id keyword instead of
+        # re-scanning every scheme id per request
+        cls._subsidy_schemes = [
+            scheme for scheme in (*cls._active_schemes, *punjab_pool)
+            if "subsidy" in scheme.id or "fertilizer" in scheme.id or "seed" in scheme.id
+        ]
+
+        # Recommendation payloads for every bisect cut point over the
+        # sorted schemes, so a recommendation is a bisect plus two lookups.
+        reco_entries = tuple(
+            SchemeBrief(
+                scheme_id=scheme.id,
+                name=scheme.name,
+                amount=scheme.amount,
+                eligibility=scheme.eligibility,
+            )
+            for scheme in cls._active_schemes
+        )
+        cls._reco_suffixes = [reco_entries[start:] for start in range(len(reco_entries) + 1)]
+        cls._reco_benefits = [
+            sum(brief.amount for brief in briefs if isinstance(brief.amount, (int, float)))
+            for briefs in cls._reco_suffixes
+        ]
+
+        cls._data_loaded = True
+
+    async def process(self, query: str, user_context: Dict, language: str = "hi") -> str:
+        """Process policy-related queries"""
+        try:
+            # Analyze query type
+            query_type = self._analyze_policy_query(query)
+
+            lang = "hi" if language == "hi" else "en"
+
+            static = _STATIC_RESPONSES.get((query_type, lang))
+            if static is not None:
+                return static
+
+            # The remaining handlers depend only on a small hashable
+            # projection of the user context, so their responses are
+            # served from the per-instance cache.
+            land_area = int(user_context.get("land_area", 0))
+            location = user_context.get("location", "Punjab")
+            return self._compute_response_cached(query_type, lang, land_area, location)
+                
+        except Exception as e:
+            logger.error(f"❌ Error in Policy Agent: {e}")
+            return self._get_error_response(language)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _analyze_policy_query(query: str) -> str:
+        """Analyze the type of policy query.
+
+        Classification is pure, so repeated queries are served from the
+        shared LRU cache.
+        """
+        query_lower = query.lower()
+
+        # Single-keyword queries skip the automaton scan entirely
+        exact = _KEYWORD_EXACT.get(query_lower.strip())
+        if exact is not None:
+            return exact
+
+        matched: set = set()
+        for _, types in _QUERY_AUTOMATON.iter(query_lower):
+            matched |= types
+        for query_type in _QUERY_TYPE_PRIORITY:
+            if query_type in matched:
+                return query_type
+        return "general"
+
+    def _compute_response(self, query_type: str, language: str, land_area: int, location: str) -> str:
+        """Compute a response from the hashable context projection.
+
+        Wrapped by the per-instance LRU cache in __init__; land area is
+        bucketed to whole acres so nearby contexts share an entry.
+        """
+        user_context = {"land_area": land_area, "location": location}
+        if query_type == "scheme_info":
+            return self._handle_scheme_info(user_context, language)
+        elif query_type == "eligibility_check":
+            return self._handle_eligibility_check(user_context, language)
+        else:
+            return self._handle_subsidy_info(user_context, language)
+
+    def _handle_scheme_info(self, user_context: Dict, language: str) -> str:
+        """Handle scheme information queries"""
+        land_area = user_context.get("land_area", 0)
+        location = user_context.get("location", "Punjab")
+        
+        # Schemes are sorted by land limit; everything from the insertion
+        # point onwards admits this land area.
+        start = bisect.bisect_left(self._limits, land_area)
+        relevant_schemes = list(self._active_schemes[start:])
+
+        # Add state-specific schemes
+        relevant_schemes.extend(self.state_schemes.get(location, ()))
+
+        render_attr = "render_hi" if language == "hi" else "render_en"
+        parts = [_SCHEME_HEADER[language]]
+        parts.extend(getattr(scheme, render_attr) for scheme in relevant_schemes[:5])
+        parts.append(_SCHEME_FOOTER[language])
+        return "".join(parts)
+    
+    def _handle_eligibility_check(self, user_context: Dict, language: str) -> str:
+        """Handle eligibility check queries"""
+        land_area = user_context.get("land_area", 0)
+        location = user_context.get("location", "Punjab")
+        
+        # One vectorized compare yields the eligibility mask for all schemes
+        mask = self._land_limits_np >= land_area
+        yes_reason = f"Land area: {land_area} acres"
+        yes_blocks = self._elig_yes[language]
+        no_blocks = self._elig_no[language]
+
+        parts = [_ELIGIBILITY_HEADER[language]]
+        for index, eligible in enumerate(mask):
+            parts.append(yes_blocks[index].format(reason=yes_reason) if eligible else no_blocks[index])
+        parts.append(_ELIGIBILITY_FOOTER[language])
+        return "".join(parts)
+    
+    def _handle_subsidy_info(self, user_context: Dict, language: str) -> str:
+        """Handle subsidy information queries"""
+        render_attr = "render_subsidy_hi" if language == "hi" else "render_subsidy_en"
+        parts = [_SUBSIDY_HEADER[language]]
+        parts.extend(getattr(scheme, render_attr) for scheme in self._subsidy_schemes)
+        parts.append(_SUBSIDY_FOOTER[language])
+        return "".join(parts)
     
     def _get_error_response(self, language: str) -> str:
         """Error response in appropriate language"""
@@ -540,7 +501,7 @@ Do you want to know about specific schemes, subsidies, or application process?""
         else:
             return "Sorry, there's an issue providing government scheme information. Please try again later."
     
-    async def get_scheme_recommendations(self, user_id: str) -> Dict[str, Any]:
+    def get_scheme_recommendations(self, user_id: str) -> SchemeRecommendations:
         """Get personalized scheme recommendations for a user"""
         # Mock user context - in production would fetch from database
         user_context = {
@@ -548,21 +509,10 @@ Do you want to know about specific schemes, subsidies, or application process?""
             "land_area": 5.0,
             "location": "Punjab"
         }
-        
-        relevant_schemes = []
-        for scheme_id, scheme_data in self.schemes.items():
-            if scheme_data["status"] == "active":
-                land_limit = scheme_data.get("land_limit", float('inf'))
-                if user_context["land_area"] <= land_limit:
-                    relevant_schemes.append({
-                        "scheme_id": scheme_id,
-                        "name": scheme_data["name"],
-                        "amount": scheme_data.get("amount", "Variable"),
-                        "eligibility": scheme_data.get("eligibility", [])
-                    })
-        
-        return {
-            "user_id": user_id,
-            "recommended_schemes": relevant_schemes,
-            "total_benefit": sum(scheme.get("amount", 0) for scheme in relevant_schemes if isinstance(scheme.get("amount"), (int, float)))
-        }
+
+        start = bisect.bisect_left(self._limits, user_context["land_area"])
+        return SchemeRecommendations(
+            user_id=user_id,
+            recommended_schemes=self._reco_suffixes[start],
+            total_benefit=self._reco_benefits[start],
+        )
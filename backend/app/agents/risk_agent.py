@@ -1,488 +1,410 @@
 import asyncio
+import functools
 import json
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+import ahocorasick
 from loguru import logger
 from app.core.config import settings
 
-class RiskAgent:
-    """
-    Risk Agent - Handles weather alerts, pest outbreaks, and risk management
-    for Indian farmers.
+# Keyword sets for query-type classification, compiled below into an
+# Aho-Corasick automaton so a query is scanned once for every keyword.
+_TYPE_KEYWORDS = {
+    "weather_alert": frozenset({"weather", "rain", "drought", "flood", "mausam"}),
+    "pest_alert": frozenset({"pest", "disease", "keet", "rogi"}),
+    "risk_assessment": frozenset({"risk", "danger", "threat", "khatra"}),
+    "mitigation_strategy": frozenset({"prevent", "protect", "save", "bachao"}),
+}
+
+# Same precedence as the old if/elif chain
+_QUERY_TYPE_PRIORITY = ("weather_alert", "pest_alert", "risk_assessment", "mitigation_strategy")
+
+def _build_query_automaton() -> "ahocorasick.Automaton":
+    """Compile the keyword tables into a single Aho-Corasick automaton.
+
+    Keywords shared by several query types carry the full set of types
+    they indicate, so one pass over the query collects every match.
     """
-    
-    def __init__(self):
-        self.name = "Risk Agent"
-        self.description = "Specialized in weather alerts, pest management, and risk mitigation"
-        self.initialized = False
-        
-    async def initialize(self):
-        """Initialize the risk agent with weather and pest data"""
-        try:
-            await self._load_risk_data()
-            self.initialized = True
-            logger.info("⚠️ Risk Agent initialized successfully")
-        except Exception as e:
-            logger.error(f"❌ Error initializing Risk Agent: {e}")
-            raise
-    
-    async def _load_risk_data(self):
-        """Load weather, pest, and risk data"""
-        # Weather patterns and forecasts for Punjab
-        self.weather_data = {
-            "current_conditions": {
-                "temperature": "32°C",
-                "humidity": "65%",
-                "wind_speed": "12 km/h",
-                "precipitation_chance": "20%",
-                "uv_index": "High",
-                "last_updated": "2024-08-18"
-            },
-            "seasonal_forecast": {
-                "monsoon_2024": {
-                    "start_date": "June 15, 2024",
-                    "end_date": "September 30, 2024",
-                    "expected_rainfall": "650mm",
-                    "normal_rainfall": "600mm",
-                    "deviation": "+8%",
-                    "risk_level": "Low"
-                },
-                "winter_2024": {
-                    "start_date": "December 1, 2024",
-                    "end_date": "February 28, 2025",
-                    "expected_rainfall": "150mm",
-                    "normal_rainfall": "120mm",
-                    "deviation": "+25%",
-                    "risk_level": "Medium"
-                }
-            },
-            "extreme_events": {
-                "drought_risk": {
-                    "probability": "15%",
-                    "affected_districts": ["Bathinda", "Mansa", "Muktsar"],
-                    "impact": "Crop failure, water scarcity",
-                    "mitigation": "Drip irrigation, drought-resistant crops"
-                },
-                "flood_risk": {
-                    "probability": "10%",
-                    "affected_districts": ["Amritsar", "Gurdaspur", "Tarn Taran"],
-                    "impact": "Crop damage, soil erosion",
-                    "mitigation": "Drainage systems, elevated storage"
-                },
-                "heat_wave_risk": {
-                    "probability": "25%",
-                    "affected_districts": ["All districts"],
-                    "impact": "Crop stress, reduced yield",
-                    "mitigation": "Shade nets, frequent irrigation"
-                },
-                "frost_risk": {
-                    "probability": "20%",
-                    "affected_districts": ["Patiala", "Sangrur", "Ludhiana"],
-                    "impact": "Winter crop damage",
-                    "mitigation": "Frost protection, crop timing"
-                }
-            }
+    keyword_types: Dict[str, set] = {}
+    for query_type, keywords in _TYPE_KEYWORDS.items():
+        for keyword in keywords:
+            keyword_types.setdefault(keyword, set()).add(query_type)
+
+    automaton = ahocorasick.Automaton()
+    for keyword, types in keyword_types.items():
+        automaton.add_word(keyword, frozenset(types))
+    automaton.make_automaton()
+    return automaton
+
+_QUERY_AUTOMATON = _build_query_automaton()
+
+# Static risk reference data, built once at import and shared by every
+# agent instance; top-level views are read-only.
+
+# Weather patterns and forecasts for Punjab
+_WEATHER_DATA = MappingProxyType({
+    "current_conditions": {
+        "temperature": "32°C",
+        "humidity": "65%",
+        "wind_speed": "12 km/h",
+        "precipitation_chance": "20%",
+        "uv_index": "High",
+        "last_updated": "2024-08-18"
+    },
+    "seasonal_forecast": {
+        "monsoon_2024": {
+            "start_date": "June 15, 2024",
+            "end_date": "September 30, 2024",
+            "expected_rainfall": "650mm",
+            "normal_rainfall": "600mm",
+            "deviation": "+8%",
+            "risk_level": "Low"
+        },
+        "winter_2024": {
+            "start_date": "December 1, 2024",
+            "end_date": "February 28, 2025",
+            "expected_rainfall": "150mm",
+            "normal_rainfall": "120mm",
+            "deviation": "+25%",
+            "risk_level": "Medium"
         }
-        
-        # Pest and disease monitoring
-        self.pest_data = {
-            "current_threats": {
-                "fall_armyworm": {
-                    "crops_affected": ["maize", "sugarcane"],
-                    "severity": "High",
-                    "affected_districts": ["Ludhiana", "Jalandhar", "Amritsar"],
-                    "control_measures": ["Biological control", "Chemical pesticides", "Crop rotation"],
-                    "economic_impact": "Up to 40% yield loss"
-                },
-                "pink_bollworm": {
-                    "crops_affected": ["cotton"],
-                    "severity": "Medium",
-                    "affected_districts": ["Bathinda", "Mansa", "Muktsar"],
-                    "control_measures": ["Bt cotton", "Pheromone traps", "Early harvest"],
-                    "economic_impact": "Up to 25% yield loss"
-                },
-                "brown_planthopper": {
-                    "crops_affected": ["rice"],
-                    "severity": "Low",
-                    "affected_districts": ["Patiala", "Sangrur"],
-                    "control_measures": ["Resistant varieties", "Biological control", "Water management"],
-                    "economic_impact": "Up to 15% yield loss"
-                },
-                "yellow_rust": {
-                    "crops_affected": ["wheat"],
-                    "severity": "Medium",
-                    "affected_districts": ["All districts"],
-                    "control_measures": ["Resistant varieties", "Fungicides", "Early sowing"],
-                    "economic_impact": "Up to 20% yield loss"
-                }
-            },
-            "preventive_measures": {
-                "integrated_pest_management": {
-                    "cultural_practices": ["Crop rotation", "Field sanitation", "Timely sowing"],
-                    "biological_control": ["Trichogramma", "Neem products", "Bacillus thuringiensis"],
-                    "chemical_control": ["Targeted spraying", "Resistance management", "Safe intervals"],
-                    "monitoring": ["Pheromone traps", "Field scouting", "Weather-based alerts"]
-                }
-            }
+    },
+    "extreme_events": {
+        "drought_risk": {
+            "probability": "15%",
+            "affected_districts": ["Bathinda", "Mansa", "Muktsar"],
+            "impact": "Crop failure, water scarcity",
+            "mitigation": "Drip irrigation, drought-resistant crops"
+        },
+        "flood_risk": {
+            "probability": "10%",
+            "affected_districts": ["Amritsar", "Gurdaspur", "Tarn Taran"],
+            "impact": "Crop damage, soil erosion",
+            "mitigation": "Drainage systems, elevated storage"
+        },
+        "heat_wave_risk": {
+            "probability": "25%",
+            "affected_districts": ["All districts"],
+            "impact": "Crop stress, reduced yield",
+            "mitigation": "Shade nets, frequent irrigation"
+        },
+        "frost_risk": {
+            "probability": "20%",
+            "affected_districts": ["Patiala", "Sangrur", "Ludhiana"],
+            "impact": "Winter crop damage",
+            "mitigation": "Frost protection, crop timing"
         }
-        
-        # Market and financial risks
-        self.market_risks = {
-            "price_volatility": {
-                "wheat": {
-                    "volatility_index": "Medium",
-                    "risk_factors": ["Export policies", "Government procurement", "Global prices"],
-                    "mitigation": ["Forward contracts", "Diversification", "Storage facilities"]
-                },
-                "rice": {
-                    "volatility_index": "High",
-                    "risk_factors": ["Export demand", "Monsoon impact", "International prices"],
-                    "mitigation": ["Contract farming", "Value addition", "Market timing"]
-                },
-                "cotton": {
-                    "volatility_index": "Very High",
-                    "risk_factors": ["Textile industry demand", "Import policies", "Global supply"],
-                    "mitigation": ["Insurance", "Diversification", "Quality improvement"]
-                },
-                "sugarcane": {
-                    "volatility_index": "Low",
-                    "risk_factors": ["Sugar mill policies", "Government pricing", "Transport costs"],
-                    "mitigation": ["Contract farming", "Cooperative membership", "Local processing"]
-                }
-            },
-            "credit_risks": {
-                "loan_default": {
-                    "probability": "8%",
-                    "risk_factors": ["Crop failure", "Price crash", "Natural calamities"],
-                    "mitigation": ["Crop insurance", "Diversification", "Emergency funds"]
-                },
-                "interest_rate": {
-                    "current_rate": "7.0%",
-                    "trend": "Stable",
-                    "risk_factors": ["RBI policies", "Inflation", "Economic conditions"],
-                    "mitigation": ["Fixed rate loans", "Early repayment", "Refinancing options"]
-                }
-            }
+    }
+})
+
+# Pest and disease monitoring
+_PEST_DATA = MappingProxyType({
+    "current_threats": {
+        "fall_armyworm": {
+            "crops_affected": ["maize", "sugarcane"],
+            "severity": "High",
+            "affected_districts": ["Ludhiana", "Jalandhar", "Amritsar"],
+            "control_measures": ["Biological control", "Chemical pesticides", "Crop rotation"],
+            "economic_impact": "Up to 40% yield loss"
+        },
+        "pink_bollworm": {
+            "crops_affected": ["cotton"],
+            "severity": "Medium",
+            "affected_districts": ["Bathinda", "Mansa", "Muktsar"],
+            "control_measures": ["Bt cotton", "Pheromone traps", "Early harvest"],
+            "economic_impact": "Up to 25% yield loss"
+        },
+        "brown_planthopper": {
+            "crops_affected": ["rice"],
+            "severity": "Low",
+            "affected_districts": ["Patiala", "Sangrur"],
+            "control_measures": ["Resistant varieties", "Biological control", "Water management"],
+            "economic_impact": "Up to 15% yield loss"
+        },
+        "yellow_rust": {
+            "crops_affected": ["wheat"],
+            "severity": "Medium",
+            "affected_districts": ["All districts"],
+            "control_measures": ["Resistant varieties", "Fungicides", "Early sowing"],
+            "economic_impact": "Up to 20% yield loss"
         }
-        
-        # Climate change risks
-        self.climate_risks = {
-            "temperature_changes": {
-                "current_trend": "+0.5°C per decade",
-                "projected_2050": "+2.0°C",
-                "impact": "Reduced crop yields, increased water demand",
-                "adaptation": ["Heat-resistant varieties", "irrigation systems"]
-            },
-            "rainfall_patterns": {
-                "current_trend": "Erratic rainfall",
-                "projected_2050": "Increased variability",
-                "impact": "Drought and flood risks",
-                "adaptation": ["Water harvesting", "drainage systems"]
-            },
-            "extreme_events": {
-                "frequency": "Increasing",
-                "types": ["Heat waves", "Heavy rainfall", "Droughts"],
-                "impact": "Crop damage, infrastructure loss",
-                "adaptation": ["Early warning systems", "resilient infrastructure"]
-            }
+    },
+    "preventive_measures": {
+        "integrated_pest_management": {
+            "cultural_practices": ["Crop rotation", "Field sanitation", "Timely sowing"],
+            "biological_control": ["Trichogramma", "Neem products", "Bacillus thuringiensis"],
+            "chemical_control": ["Targeted spraying", "Resistance management", "Safe intervals"],
+            "monitoring": ["Pheromone traps", "Field scouting", "Weather-based alerts"]
         }
-        
-        # Risk assessment matrix
-        self.risk_matrix = {
-            "low_risk": {
-                "probability": "0-20%",
-                "impact": "Minimal",
-                "action": "Monitor and maintain current practices"
-            },
-            "medium_risk": {
-                "probability": "21-50%",
-                "impact": "Moderate",
-                "action": "Implement preventive measures"
-            },
-            "high_risk": {
-                "probability": "51-80%",
-                "impact": "Significant",
-                "action": "Develop contingency plans"
-            },
-            "very_high_risk": {
-                "probability": "81-100%",
-                "impact": "Severe",
-                "action": "Immediate action required"
-            }
+    }
+})
+
+# Market and financial risks
+_MARKET_RISKS = MappingProxyType({
+    "price_volatility": {
+        "wheat": {
+            "volatility_index": "Medium",
+            "risk_factors": ["Export policies", "Government procurement", "Global prices"],
+            "mitigation": ["Forward contracts", "Diversification", "Storage facilities"]
+        },
+        "rice": {
+            "volatility_index": "High",
+            "risk_factors": ["Export demand", "Monsoon impact", "International prices"],
+            "mitigation": ["Contract farming", "Value addition", "Market timing"]
+        },
+        "cotton": {
+            "volatility_index": "Very High",
+            "risk_factors": ["Textile industry demand", "Import policies", "Global supply"],
+            "mitigation": ["Insurance", "Diversification", "Quality improvement"]
+        },
+        "sugarcane": {
+            "volatility_index": "Low",
+            "risk_factors": ["Sugar mill policies", "Government pricing", "Transport costs"],
+            "mitigation": ["Contract farming", "Cooperative membership", "Local processing"]
         }
-        
-        # Risk mitigation strategies
-        self.mitigation_strategies = {
-            "weather_risks": {
-                "drought": ["Drip irrigation", "Drought-resistant crops", "Water harvesting"],
-                "flood": ["Drainage systems", "Elevated storage", "Flood-resistant crops"],
-                "frost": ["Frost protection", "Crop timing", "Greenhouse farming"],
-                "heat_wave": ["Shade nets", "Frequent irrigation", "Heat-resistant varieties"]
-            },
-            "pest_risks": {
-                "prevention": ["Crop rotation", "Field sanitation", "Resistant varieties"],
-                "control": ["Biological control", "Integrated pest management", "Monitoring"],
-                "recovery": ["Replanting", "Insurance claims", "Alternative crops"]
-            },
-            "market_risks": {
-                "price_volatility": ["Forward contracts", "Diversification", "Value addition"],
-                "demand_fluctuation": ["Market research", "Contract farming", "Storage facilities"],
-                "supply_chain": ["Multiple suppliers", "Local processing", "Cooperative membership"]
-            },
-            "financial_risks": {
-                "credit": ["Crop insurance", "Emergency funds", "Diversified income"],
-                "interest_rate": ["Fixed rate loans", "Early repayment", "Refinancing"],
-                "currency": ["Local markets", "Forward contracts", "Hedging strategies"]
-            }
+    },
+    "credit_risks": {
+        "loan_default": {
+            "probability": "8%",
+            "risk_factors": ["Crop failure", "Price crash", "Natural calamities"],
+            "mitigation": ["Crop insurance", "Diversification", "Emergency funds"]
+        },
+        "interest_rate": {
+            "current_rate": "7.0%",
+            "trend": "Stable",
+            "risk_factors": ["RBI policies", "Inflation", "Economic conditions"],
+            "mitigation": ["Fixed rate loans", "Early repayment", "Refinancing options"]
         }
-    
-    async def process(self, query: str, user_context: Dict, language: str = "hi") -> str:
-        """Process risk-related queries"""
-        try:
-            # Analyze query type
-            query_type = self._analyze_risk_query(query)
-            
-            if query_type == "weather_alert":
-                return await self._handle_weather_alert(user_context, language)
-            elif query_type == "pest_alert":
-                return await self._handle_pest_alert(user_context, language)
-            elif query_type == "risk_assessment":
-                return await self._handle_risk_assessment(user_context, language)
-            elif query_type == "mitigation_strategy":
-                return await self._handle_mitigation_strategy(user_context, language)
-            else:
-                return await self._handle_general_risk_query(query, user_context, language)
-                
-        except Exception as e:
-            logger.error(f"❌ Error in Risk Agent: {e}")
-            return self._get_error_response(language)
-    
-    def _analyze_risk_query(self, query: str) -> str:
-        """Analyze the type of risk query"""
-        query_lower = query.lower()
-        
-        if any(word in query_lower for word in ["weather", "rain", "drought", "flood", "mausam"]):
-            return "weather_alert"
-        elif any(word in query_lower for word in ["pest", "disease", "keet", "rogi"]):
-            return "pest_alert"
-        elif any(word in query_lower for word in ["risk", "danger", "threat", "khatra"]):
-            return "risk_assessment"
-        elif any(word in query_lower for word in ["prevent", "protect", "save", "bachao"]):
-            return "mitigation_strategy"
-        else:
-            return "general"
-    
-    async def _handle_weather_alert(self, user_context: Dict, language: str) -> str:
-        """Handle weather alert queries"""
-        location = user_context.get("location", "Punjab")
-        current_crops = user_context.get("current_crops", [])
-        
-        # Get relevant weather alerts for the location
-        relevant_alerts = []
-        for alert_type, alert_data in self.weather_alerts.items():
-            if location in alert_data["affected_regions"]:
-                relevant_alerts.append({
-                    "type": alert_type,
-                    "data": alert_data
-                })
-        
-        if language == "hi":
-            if relevant_alerts:
-                response = f"⚠️ {location} के लिए मौसम चेतावनी:\n\n"
-                
-                for alert in relevant_alerts:
-                    data = alert["data"]
-                    risk_emoji = "🔴" if data["risk_level"] == "high" else "🟡"
-                    response += f"""{risk_emoji} {alert['type'].title()}:
-📊 जोखिम स्तर: {data['risk_level'].title()}
-💥 प्रभाव: {data['impact']}
-🛡️ बचाव: {data['mitigation']}
-
-"""
-                
-                response += "📱 अलर्ट प्राप्त करने के लिए:\n"
-                response += "• IMD वेबसाइट पर जाएं\n"
-                response += "• मौसम ऐप डाउनलोड करें\n"
-                response += "• कृषि विभाग से संपर्क करें"
-            else:
-                response = f"✅ {location} में कोई मौसम चेतावनी नहीं है।\n\n"
-                response += "🌤️ वर्तमान मौसम स्थिति सामान्य है।"
-            
-            return response
-        else:
-            if relevant_alerts:
-                response = f"⚠️ Weather Alert for {location}:\n\n"
-                
-                for alert in relevant_alerts:
-                    data = alert["data"]
-                    risk_emoji = "🔴" if data["risk_level"] == "high" else "🟡"
-                    response += f"""{risk_emoji} {alert['type'].title()}:
-📊 Risk Level: {data['risk_level'].title()}
-💥 Impact: {data['impact']}
-🛡️ Mitigation: {data['mitigation']}
-
-"""
-                
-                response += "📱 To receive alerts:\n"
-                response += "• Visit IMD website\n"
-                response += "• Download weather app\n"
-                response += "• Contact agriculture department"
-            else:
-                response = f"✅ No weather alerts for {location}.\n\n"
-                response += "🌤️ Current weather conditions are normal."
-            
-            return response
-    
-    async def _handle_pest_alert(self, user_context: Dict, language: str) -> str:
-        """Handle pest alert queries"""
-        location = user_context.get("location", "Punjab")
-        current_crops = user_context.get("current_crops", [])
-        
-        # Get relevant pest alerts
-        relevant_pests = []
-        for pest_type, pest_data in self.pest_alerts.items():
-            if location in pest_data["affected_regions"]:
-                # Check if user's crops are affected
-                affected_crops = pest_data["affected_crops"]
-                user_crops = [crop.get("name", "") for crop in current_crops]
-                if any(crop in affected_crops for crop in user_crops):
-                    relevant_pests.append({
-                        "type": pest_type,
-                        "data": pest_data
-                    })
-        
-        if language == "hi":
-            if relevant_pests:
-                response = f"🐛 {location} में कीट चेतावनी:\n\n"
-                
-                for pest in relevant_pests:
-                    data = pest["data"]
-                    risk_emoji = "🔴" if data["risk_level"] == "high" else "🟡"
-                    response += f"""{risk_emoji} {pest['type'].replace('_', ' ').title()}:
-📊 जोखिम स्तर: {data['risk_level'].title()}
-🌾 प्रभावित फसलें: {', '.join(data['affected_crops'])}
-🔍 लक्षण: {data['symptoms']}
-🛡️ नियंत्रण: {data['control']}
-
-"""
-                
-                response += "💡 कीट प्रबंधन सुझाव:\n"
-                response += "• नियमित निरीक्षण करें\n"
-                response += "• जैविक कीटनाशक प्रयोग करें\n"
-                response += "• फसल चक्र अपनाएं\n"
-                response += "• कृषि विभाग से सलाह लें"
-            else:
-                response = f"✅ {location} में कोई कीट चेतावनी नहीं है।\n\n"
-                response += "🌱 आपकी फसलें सुरक्षित हैं।"
-            
-            return response
-        else:
-            if relevant_pests:
-                response = f"🐛 Pest Alert for {location}:\n\n"
-                
-                for pest in relevant_pests:
-                    data = pest["data"]
-                    risk_emoji = "🔴" if data["risk_level"] == "high" else "🟡"
-                    response += f"""{risk_emoji} {pest['type'].replace('_', ' ').title()}:
-📊 Risk Level: {data['risk_level'].title()}
-🌾 Affected Crops: {', '.join(data['affected_crops'])}
-🔍 Symptoms: {data['symptoms']}
-🛡️ Control: {data['control']}
-
-"""
-                
-                response += "💡 Pest Management Tips:\n"
-                response += "• Regular monitoring\n"
-                response += "• Use organic pesticides\n"
-                response += "• Follow crop rotation\n"
-                response += "• Consult agriculture department"
-            else:
-                response = f"✅ No pest alerts for {location}.\n\n"
-                response += "🌱 Your crops are safe."
-            
-            return response
-    
-    async def _handle_risk_assessment(self, user_context: Dict, language: str) -> str:
-        """Handle risk assessment queries"""
-        location = user_context.get("location", "Punjab")
-        current_crops = user_context.get("current_crops", [])
-        current_season = self._get_current_season()
-        
-        # Assess overall risk
-        risk_factors = []
-        
-        # Weather risks
-        for alert_type, alert_data in self.weather_alerts.items():
-            if location in alert_data["affected_regions"]:
-                risk_factors.append(f"Weather: {alert_type}")
-        
-        # Pest risks
-        for pest_type, pest_data in self.pest_alerts.items():
-            if location in pest_data["affected_regions"]:
-                affected_crops = pest_data["affected_crops"]
-                user_crops = [crop.get("name", "") for crop in current_crops]
-                if any(crop in affected_crops for crop in user_crops):
-                    risk_factors.append(f"Pest: {pest_type}")
-        
-        # Seasonal risks
-        seasonal_risks = self.seasonal_risks.get(current_season, {})
-        for risk_type, risk_desc in seasonal_risks.items():
-            risk_factors.append(f"Seasonal: {risk_type}")
-        
-        if language == "hi":
-            response = f"🔍 आपकी फसलों का जोखिम मूल्यांकन:\n\n"
-            
-            response += f"📍 स्थान: {location}\n"
-            response += f"🌾 फसलें: {len(current_crops)} फसलें\n"
-            response += f"📅 मौसम: {current_season.title()}\n\n"
-            
-            if risk_factors:
-                response += "⚠️ पहचाने गए जोखिम:\n"
-                for i, risk in enumerate(risk_factors, 1):
-                    response += f"{i}. {risk}\n"
-                
-                response += f"\n📊 कुल जोखिम स्तर: {'उच्च' if len(risk_factors) > 3 else 'मध्यम' if len(risk_factors) > 1 else 'कम'}\n"
-            else:
-                response += "✅ कोई जोखिम नहीं पहचाना गया।\n"
-            
-            response += "\n💡 सुझाव:\n"
-            response += "• नियमित निगरानी करें\n"
-            response += "• बीमा करवाएं\n"
-            response += "• विविधीकरण करें\n"
-            response += "• आपातकालीन योजना बनाएं"
-            
-            return response
-        else:
-            response = f"🔍 Risk Assessment for Your Crops:\n\n"
-            
-            response += f"📍 Location: {location}\n"
-            response += f"🌾 Crops: {len(current_crops)} crops\n"
-            response += f"📅 Season: {current_season.title()}\n\n"
-            
-            if risk_factors:
-                response += "⚠️ Identified Risks:\n"
-                for i, risk in enumerate(risk_factors, 1):
-                    response += f"{i}. {risk}\n"
-                
-                response += f"\n📊 Overall Risk Level: {'High' if len(risk_factors) > 3 else 'Medium' if len(risk_factors) > 1 else 'Low'}\n"
-            else:
-                response += "✅ No risks identified.\n"
-            
-            response += "\n💡 Recommendations:\n"
-            response += "• Regular monitoring\n"
-            response += "• Get insurance\n"
-            response += "• Diversify crops\n"
-            response += "• Plan for emergencies"
-            
-            return response
-    
-    async def _handle_mitigation_strategy(self, user_context: Dict, language: str) -> str:
-        """Handle mitigation strategy queries"""
-        location = user_context.get("location", "Punjab")
-        current_crops = user_context.get("current_crops", [])
-        
-        if language == "hi":
-            return f"""🛡️ जोखिम कम करने की रणनीतियां:
+    }
+})
+
+# Climate change risks
+_CLIMATE_RISKS = MappingProxyType({
+    "temperature_changes": {
+        "current_trend": "+0.5°C per decade",
+        "projected_2050": "+2.0°C",
+        "impact": "Reduced crop yields, increased water demand",
+        "adaptation": ["Heat-resistant varieties", "irrigation systems"]
+    },
+    "rainfall_patterns": {
+        "current_trend": "Erratic rainfall",
+        "projected_2050": "Increased variability",
+        "impact": "Drought and flood risks",
+        "adaptation": ["Water harvesting", "drainage systems"]
+    },
+    "extreme_events": {
+        "frequency": "Increasing",
+        "types": ["Heat waves", "Heavy rainfall", "Droughts"],
+        "impact": "Crop damage, infrastructure loss",
+        "adaptation": ["Early warning systems", "resilient infrastructure"]
+    }
+})
+
+# Risk assessment matrix
+_RISK_MATRIX = MappingProxyType({
+    "low_risk": {
+        "probability": "0-20%",
+        "impact": "Minimal",
+        "action": "Monitor and maintain current practices"
+    },
+    "medium_risk": {
+        "probability": "21-50%",
+        "impact": "Moderate",
+        "action": "Implement preventive measures"
+    },
+    "high_risk": {
+        "probability": "51-80%",
+        "impact": "Significant",
+        "action": "Develop contingency plans"
+    },
+    "very_high_risk": {
+        "probability": "81-100%",
+        "impact": "Severe",
+        "action": "Immediate action required"
+    }
+})
+
+# Risk mitigation strategies
+_MITIGATION_STRATEGIES = MappingProxyType({
+    "weather_risks": {
+        "drought": ["Drip irrigation", "Drought-resistant crops", "Water harvesting"],
+        "flood": ["Drainage systems", "Elevated storage", "Flood-resistant crops"],
+        "frost": ["Frost protection", "Crop timing", "Greenhouse farming"],
+        "heat_wave": ["Shade nets", "Frequent irrigation", "Heat-resistant varieties"]
+    },
+    "pest_risks": {
+        "prevention": ["Crop rotation", "Field sanitation", "Resistant varieties"],
+        "control": ["Biological control", "Integrated pest management", "Monitoring"],
+        "recovery": ["Replanting", "Insurance claims", "Alternative crops"]
+    },
+    "market_risks": {
+        "price_volatility": ["Forward contracts", "Diversification", "Value addition"],
+        "demand_fluctuation": ["Market research", "Contract farming", "Storage facilities"],
+        "supply_chain": ["Multiple suppliers", "Local processing", "Cooperative membership"]
+    },
+    "financial_risks": {
+        "credit": ["Crop insurance", "Emergency funds", "Diversified income"],
+        "interest_rate": ["Fixed rate loans", "Early repayment", "Refinancing"],
+        "currency": ["Local markets", "Forward contracts", "Hedging strategies"]
+    }
+})
+
+# Active weather alerts consulted by the alert and assessment handlers
+_WEATHER_ALERTS = MappingProxyType({
+    "heat_wave": {
+        "risk_level": "high",
+        "affected_regions": ["Punjab", "Ludhiana", "Bathinda", "Mansa"],
+        "impact": "Crop stress, reduced yield",
+        "mitigation": "Shade nets, frequent irrigation"
+    },
+    "drought": {
+        "risk_level": "medium",
+        "affected_regions": ["Bathinda", "Mansa", "Muktsar"],
+        "impact": "Crop failure, water scarcity",
+        "mitigation": "Drip irrigation, drought-resistant crops"
+    },
+    "flood": {
+        "risk_level": "medium",
+        "affected_regions": ["Amritsar", "Gurdaspur", "Tarn Taran"],
+        "impact": "Crop damage, soil erosion",
+        "mitigation": "Drainage systems, elevated storage"
+    },
+    "frost": {
+        "risk_level": "low",
+        "affected_regions": ["Patiala", "Sangrur", "Ludhiana"],
+        "impact": "Winter crop damage",
+        "mitigation": "Frost protection, crop timing"
+    }
+})
+
+# Active pest alerts with the crops and regions they threaten
+_PEST_ALERTS = MappingProxyType({
+    "fall_armyworm": {
+        "risk_level": "high",
+        "affected_regions": ["Punjab", "Ludhiana", "Jalandhar", "Amritsar"],
+        "affected_crops": ["maize", "sugarcane"],
+        "symptoms": "Ragged leaf feeding, windowed patches on leaves",
+        "control": "Biological control, targeted pesticides, crop rotation"
+    },
+    "pink_bollworm": {
+        "risk_level": "medium",
+        "affected_regions": ["Bathinda", "Mansa", "Muktsar"],
+        "affected_crops": ["cotton"],
+        "symptoms": "Rosetted flowers, damaged bolls",
+        "control": "Bt cotton, pheromone traps, early harvest"
+    },
+    "brown_planthopper": {
+        "risk_level": "low",
+        "affected_regions": ["Patiala", "Sangrur"],
+        "affected_crops": ["rice"],
+        "symptoms": "Hopper burn, yellowing patches in the field",
+        "control": "Resistant varieties, water management"
+    },
+    "yellow_rust": {
+        "risk_level": "medium",
+        "affected_regions": ["Punjab", "Patiala", "Ludhiana"],
+        "affected_crops": ["wheat"],
+        "symptoms": "Yellow stripe pustules on leaves",
+        "control": "Resistant varieties, fungicides, early sowing"
+    }
+})
+
+# Season-specific risks surfaced in risk assessments
+_SEASONAL_RISKS = MappingProxyType({
+    "kharif": {
+        "waterlogging": "Heavy monsoon spells can waterlog low-lying fields",
+        "pest_buildup": "High humidity drives pest and disease buildup"
+    },
+    "rabi": {
+        "frost": "Cold waves can damage young wheat and vegetables",
+        "unseasonal_rain": "Late rains can flatten standing crops"
+    },
+    "zaid": {
+        "heat_stress": "Rising temperatures stress short-duration crops",
+        "water_scarcity": "Falling water tables limit irrigation"
+    }
+})
+
+# Inverted alert indexes: location -> [(alert_type, alert_data)] and
+# (location, crop) -> [(pest_type, pest_data)], so the handlers replace
+# their per-request scans over every alert with dict lookups.
+_WEATHER_BY_LOCATION: Dict[str, List[tuple]] = {}
+for _alert_type, _alert_data in _WEATHER_ALERTS.items():
+    for _region in _alert_data["affected_regions"]:
+        _WEATHER_BY_LOCATION.setdefault(_region, []).append((_alert_type, _alert_data))
+
+_PESTS_BY_LOCATION_CROP: Dict[tuple, List[tuple]] = {}
+for _pest_type, _pest_data in _PEST_ALERTS.items():
+    for _region in _pest_data["affected_regions"]:
+        for _crop in _pest_data["affected_crops"]:
+            _PESTS_BY_LOCATION_CROP.setdefault((_region, _crop), []).append((_pest_type, _pest_data))
+del _alert_type, _alert_data, _pest_type, _pest_data, _region, _crop
+
+def _pests_for(location: str, user_crops) -> List[tuple]:
+    """Look up pest alerts threatening any of the user's crops here."""
+    seen = set()
+    relevant = []
+    for crop in user_crops:
+        for pest_type, pest_data in _PESTS_BY_LOCATION_CROP.get((location, crop), ()):
+            if pest_type not in seen:
+                seen.add(pest_type)
+                relevant.append((pest_type, pest_data))
+    return relevant
+
+# Per-language response fragments; dynamic rows are str.format templates
+# so the format strings are parsed once at import
+_TMPL = {
+    "hi": {
+        "weather_header": "⚠️ {location} के लिए मौसम चेतावनी:\n\n",
+        "weather_row": "{risk_emoji} {title}:\n📊 जोखिम स्तर: {risk_level}\n💥 प्रभाव: {impact}\n🛡️ बचाव: {mitigation}\n\n",
+        "weather_footer": "📱 अलर्ट प्राप्त करने के लिए:\n• IMD वेबसाइट पर जाएं\n• मौसम ऐप डाउनलोड करें\n• कृषि विभाग से संपर्क करें",
+        "weather_none": "✅ {location} में कोई मौसम चेतावनी नहीं है।\n\n🌤️ वर्तमान मौसम स्थिति सामान्य है।",
+        "pest_header": "🐛 {location} में कीट चेतावनी:\n\n",
+        "pest_row": "{risk_emoji} {title}:\n📊 जोखिम स्तर: {risk_level}\n🌾 प्रभावित फसलें: {crops}\n🔍 लक्षण: {symptoms}\n🛡️ नियंत्रण: {control}\n\n",
+        "pest_footer": "💡 कीट प्रबंधन सुझाव:\n• नियमित निरीक्षण करें\n• जैविक कीटनाशक प्रयोग करें\n• फसल चक्र अपनाएं\n• कृषि विभाग से सलाह लें",
+        "pest_none": "✅ {location} में कोई कीट चेतावनी नहीं है।\n\n🌱 आपकी फसलें सुरक्षित हैं।",
+        "assessment_header": "🔍 आपकी फसलों का जोखिम मूल्यांकन:\n\n📍 स्थान: {location}\n🌾 फसलें: {crop_count} फसलें\n📅 मौसम: {season}\n\n",
+        "risks_found": "⚠️ पहचाने गए जोखिम:\n",
+        "no_risks": "✅ कोई जोखिम नहीं पहचाना गया।\n",
+        "overall": "\n📊 कुल जोखिम स्तर: {level}\n",
+        "levels": ("कम", "मध्यम", "उच्च"),
+        "assessment_footer": "\n💡 सुझाव:\n• नियमित निगरानी करें\n• बीमा करवाएं\n• विविधीकरण करें\n• आपातकालीन योजना बनाएं",
+    },
+    "en": {
+        "weather_header": "⚠️ Weather Alert for {location}:\n\n",
+        "weather_row": "{risk_emoji} {title}:\n📊 Risk Level: {risk_level}\n💥 Impact: {impact}\n🛡️ Mitigation: {mitigation}\n\n",
+        "weather_footer": "📱 To receive alerts:\n• Visit IMD website\n• Download weather app\n• Contact agriculture department",
+        "weather_none": "✅ No weather alerts for {location}.\n\n🌤️ Current weather conditions are normal.",
+        "pest_header": "🐛 Pest Alert for {location}:\n\n",
+        "pest_row": "{risk_emoji} {title}:\n📊 Risk Level: {risk_level}\n🌾 Affected Crops: {crops}\n🔍 Symptoms: {symptoms}\n🛡️ Control: {control}\n\n",
+        "pest_footer": "💡 Pest Management Tips:\n• Regular monitoring\n• Use organic pesticides\n• Follow crop rotation\n• Consult agriculture department",
+        "pest_none": "✅ No pest alerts for {location}.\n\n🌱 Your crops are safe.",
+        "assessment_header": "🔍 Risk Assessment for Your Crops:\n\n📍 Location: {location}\n🌾 Crops: {crop_count} crops\n📅 Season: {season}\n\n",
+        "risks_found": "⚠️ Identified Risks:\n",
+        "no_risks": "✅ No risks identified.\n",
+        "overall": "\n📊 Overall Risk Level: {level}\n",
+        "levels": ("Low", "Medium", "High"),
+        "assessment_footer": "\n💡 Recommendations:\n• Regular monitoring\n• Get insurance\n• Diversify crops\n• Plan for emergencies",
+    },
+}
+
+# Agricultural season per calendar month (index = month - 1), replacing
+# the membership-test chain with one branchless lookup
+_MONTH_TO_SEASON = (
+    "rabi", "zaid", "zaid", "zaid", "zaid",
+    "kharif", "kharif", "kharif", "kharif",
+    "rabi", "rabi", "rabi",
+)
+
+@functools.lru_cache(maxsize=1)
+def _season_for(ordinal: int) -> str:
+    """Season for a date ordinal, computed at most once per day."""
+    return _MONTH_TO_SEASON[date.fromordinal(ordinal).month - 1]
+
+# Static mitigation and general-advice responses; nothing in them is
+# per-request, so the handlers return the shared constants directly
+_MITIGATION_HI = """🛡️ जोखिम कम करने की रणनीतियां:
 
 🌤️ मौसम जोखिम के लिए:
 • फसल बीमा करवाएं
@@ -506,8 +428,8 @@ class RiskAgent:
 • कृषि विभाग: 1800-180-1551
 • मौसम विभाग: 1800-180-1717
 • बीमा कंपनी: अपने बैंक से संपर्क करें"""
-        else:
-            return f"""🛡️ Risk Mitigation Strategies:
+
+_MITIGATION_EN = """🛡️ Risk Mitigation Strategies:
 
 🌤️ For Weather Risks:
 • Get crop insurance
@@ -531,11 +453,8 @@ class RiskAgent:
 • Agriculture Department: 1800-180-1551
 • Weather Department: 1800-180-1717
 • Insurance Company: Contact your bank"""
-    
-    async def _handle_general_risk_query(self, query: str, user_context: Dict, language: str) -> str:
-        """Handle general risk queries"""
-        if language == "hi":
-            return """⚠️ जोखिम प्रबंधन सलाह:
+
+_GENERAL_HI = """⚠️ जोखिम प्रबंधन सलाह:
 
 • नियमित रूप से मौसम जांचें
 • फसलों का निरीक्षण करें
@@ -544,8 +463,8 @@ class RiskAgent:
 • विविधीकरण करें
 
 क्या आप मौसम चेतावनी, कीट प्रबंधन या जोखिम कम करने के बारे में जानना चाहते हैं?"""
-        else:
-            return """⚠️ Risk Management Advice:
+
+_GENERAL_EN = """⚠️ Risk Management Advice:
 
 • Check weather regularly
 • Monitor crops
@@ -554,17 +473,163 @@ class RiskAgent:
 • Diversify
 
 Do you want to know about weather alerts, pest management, or risk reduction?"""
+
+class RiskAgent:
+    """
+    Risk Agent - Handles weather alerts, pest outbreaks, and risk management
+    for Indian farmers.
+    """
     
-    def _get_current_season(self) -> str:
-        """Get current agricultural season"""
-        current_month = datetime.now().month
+    def __init__(self):
+        self.name = "Risk Agent"
+        self.description = "Specialized in weather alerts, pest management, and risk mitigation"
+        self.initialized = False
         
-        if current_month in [6, 7, 8, 9]:
-            return "kharif"
-        elif current_month in [10, 11, 12, 1]:
-            return "rabi"
+    async def initialize(self):
+        """Initialize the risk agent with weather and pest data"""
+        try:
+            await self._load_risk_data()
+            self.initialized = True
+            logger.info("⚠️ Risk Agent initialized successfully")
+        except Exception as e:
+            logger.error(f"❌ Error initializing Risk Agent: {e}")
+            raise
+    
+    async def _load_risk_data(self):
+        """Bind the shared module-level risk datasets"""
+        self.weather_data = _WEATHER_DATA
+        self.pest_data = _PEST_DATA
+        self.market_risks = _MARKET_RISKS
+        self.climate_risks = _CLIMATE_RISKS
+        self.risk_matrix = _RISK_MATRIX
+        self.mitigation_strategies = _MITIGATION_STRATEGIES
+        self.weather_alerts = _WEATHER_ALERTS
+        self.pest_alerts = _PEST_ALERTS
+        self.seasonal_risks = _SEASONAL_RISKS
+
+    async def process(self, query: str, user_context: Dict, language: str = "hi") -> str:
+        """Process risk-related queries"""
+        try:
+            # Analyze query type
+            query_type = self._analyze_risk_query(query)
+            
+            if query_type == "weather_alert":
+                return await self._handle_weather_alert(user_context, language)
+            elif query_type == "pest_alert":
+                return await self._handle_pest_alert(user_context, language)
+            elif query_type == "risk_assessment":
+                return await self._handle_risk_assessment(user_context, language)
+            elif query_type == "mitigation_strategy":
+                return await self._handle_mitigation_strategy(user_context, language)
+            else:
+                return await self._handle_general_risk_query(query, user_context, language)
+                
+        except Exception as e:
+            logger.error(f"❌ Error in Risk Agent: {e}")
+            return self._get_error_response(language)
+    
+    def _analyze_risk_query(self, query: str) -> str:
+        """Analyze the type of risk query"""
+        matched: set = set()
+        for _, types in _QUERY_AUTOMATON.iter(query.lower()):
+            matched |= types
+        for query_type in _QUERY_TYPE_PRIORITY:
+            if query_type in matched:
+                return query_type
+        return "general"
+    
+    async def _handle_weather_alert(self, user_context: Dict, language: str) -> str:
+        """Handle weather alert queries"""
+        location = user_context.get("location", "Punjab")
+        t = _TMPL["hi" if language == "hi" else "en"]
+
+        alerts = _WEATHER_BY_LOCATION.get(location, ())
+        if not alerts:
+            return t["weather_none"].format(location=location)
+
+        parts = [t["weather_header"].format(location=location)]
+        row = t["weather_row"]
+        for alert_type, data in alerts:
+            parts.append(row.format(
+                risk_emoji="🔴" if data["risk_level"] == "high" else "🟡",
+                title=alert_type.title(),
+                risk_level=data["risk_level"].title(),
+                impact=data["impact"],
+                mitigation=data["mitigation"],
+            ))
+        parts.append(t["weather_footer"])
+        return "".join(parts)
+
+    async def _handle_pest_alert(self, user_context: Dict, language: str) -> str:
+        """Handle pest alert queries"""
+        location = user_context.get("location", "Punjab")
+        current_crops = user_context.get("current_crops", [])
+        t = _TMPL["hi" if language == "hi" else "en"]
+
+        user_crops = {crop.get("name", "") for crop in current_crops}
+        pests = _pests_for(location, user_crops)
+        if not pests:
+            return t["pest_none"].format(location=location)
+
+        parts = [t["pest_header"].format(location=location)]
+        row = t["pest_row"]
+        for pest_type, data in pests:
+            parts.append(row.format(
+                risk_emoji="🔴" if data["risk_level"] == "high" else "🟡",
+                title=pest_type.replace("_", " ").title(),
+                risk_level=data["risk_level"].title(),
+                crops=", ".join(data["affected_crops"]),
+                symptoms=data["symptoms"],
+                control=data["control"],
+            ))
+        parts.append(t["pest_footer"])
+        return "".join(parts)
+
+    async def _handle_risk_assessment(self, user_context: Dict, language: str) -> str:
+        """Handle risk assessment queries"""
+        location = user_context.get("location", "Punjab")
+        current_crops = user_context.get("current_crops", [])
+        current_season = self._get_current_season()
+        t = _TMPL["hi" if language == "hi" else "en"]
+
+        # Assess overall risk from the location and crop indexes
+        user_crops = {crop.get("name", "") for crop in current_crops}
+        risk_factors = [
+            f"Weather: {alert_type}"
+            for alert_type, _ in _WEATHER_BY_LOCATION.get(location, ())
+        ]
+        risk_factors.extend(
+            f"Pest: {pest_type}" for pest_type, _ in _pests_for(location, user_crops)
+        )
+        risk_factors.extend(
+            f"Seasonal: {risk_type}"
+            for risk_type in self.seasonal_risks.get(current_season, ())
+        )
+
+        parts = [t["assessment_header"].format(
+            location=location, crop_count=len(current_crops), season=current_season.title()
+        )]
+        if risk_factors:
+            parts.append(t["risks_found"])
+            parts.extend(f"{i}. {risk}\n" for i, risk in enumerate(risk_factors, 1))
+            level = t["levels"][2 if len(risk_factors) > 3 else 1 if len(risk_factors) > 1 else 0]
+            parts.append(t["overall"].format(level=level))
         else:
-            return "zaid"
+            parts.append(t["no_risks"])
+        parts.append(t["assessment_footer"])
+        return "".join(parts)
+
+    async def _handle_mitigation_strategy(self, user_context: Dict, language: str) -> str:
+        """Handle mitigation strategy queries"""
+        return _MITIGATION_HI if language == "hi" else _MITIGATION_EN
+
+    async def _handle_general_risk_query(self, query: str, user_context: Dict, language: str) -> str:
+        """Handle general risk queries"""
+        return _GENERAL_HI if language == "hi" else _GENERAL_EN
+
+    def _get_current_season(self) -> str:
+        """Get current agricultural season"""
+        return _season_for(datetime.now().toordinal())
     
     def _get_error_response(self, language: str) -> str:
         """Error response in appropriate language"""
@@ -585,24 +650,18 @@ Do you want to know about weather alerts, pest management, or risk reduction?"""
             "land_area": 5.0
         }
         
-        # Calculate risk score
+        # Calculate risk score from the location and crop indexes
         risk_score = 0
         risk_factors = []
-        
-        # Weather risks
-        for alert_type, alert_data in self.weather_alerts.items():
-            if user_context["location"] in alert_data["affected_regions"]:
-                risk_score += 2 if alert_data["risk_level"] == "high" else 1
-                risk_factors.append(f"Weather: {alert_type}")
-        
-        # Pest risks
-        for pest_type, pest_data in self.pest_alerts.items():
-            if user_context["location"] in pest_data["affected_regions"]:
-                affected_crops = pest_data["affected_crops"]
-                user_crops = [crop.get("name", "") for crop in user_context["current_crops"]]
-                if any(crop in affected_crops for crop in user_crops):
-                    risk_score += 2 if pest_data["risk_level"] == "high" else 1
-                    risk_factors.append(f"Pest: {pest_type}")
+        user_crops = {crop.get("name", "") for crop in user_context["current_crops"]}
+
+        for alert_type, alert_data in _WEATHER_BY_LOCATION.get(user_context["location"], ()):
+            risk_score += 2 if alert_data["risk_level"] == "high" else 1
+            risk_factors.append(f"Weather: {alert_type}")
+
+        for pest_type, pest_data in _pests_for(user_context["location"], user_crops):
+            risk_score += 2 if pest_data["risk_level"] == "high" else 1
+            risk_factors.append(f"Pest: {pest_type}")
         
         risk_level = "High" if risk_score > 4 else "Medium" if risk_score > 2 else "Low"
         
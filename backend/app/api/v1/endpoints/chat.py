@@ -1,11 +1,11 @@
 import asyncio
 import json
 from typing import Dict, List, Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, status
 from sqlalchemy.orm import Session
 from loguru import logger
 from app.core.database import get_db
-from app.agents.agent_orchestrator import agent_orchestrator
+from app.agents.agent_orchestrator import get_agent_orchestrator
 from pydantic import BaseModel
 
 router = APIRouter()
@@ -26,7 +26,8 @@ class ChatResponse(BaseModel):
 @router.post("/send", response_model=ChatResponse)
 async def send_message(
     request: ChatRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    x_debug: Optional[str] = Header(default=None)
 ):
     """Send a message to KrishiMitra and get response"""
     endpoint_start_time = asyncio.get_event_loop().time()
@@ -46,10 +47,11 @@ async def send_message(
         logger.info('🔍 Processing message with agent orchestrator...')
         
         # Process with agent orchestrator
-        result = await agent_orchestrator.process_query(
-            request.message, 
-            request.user_id or 'anonymous', 
-            request.language
+        result = await get_agent_orchestrator().process_query(
+            request.message,
+            request.user_id or 'anonymous',
+            request.language,
+            debug=x_debug == "1"
         )
         
         logger.info(f'✅ Message processed successfully')
@@ -140,7 +142,7 @@ async def get_debt_forecast(user_id: str, db: Session = Depends(get_db)):
     Get personalized debt freedom forecast for a user
     """
     try:
-        forecast = await agent_orchestrator.get_debt_forecast(user_id)
+        forecast = await get_agent_orchestrator().get_debt_forecast(user_id)
         return forecast
         
     except Exception as e:
@@ -157,7 +159,7 @@ async def get_crop_recommendations(
     Get crop recommendations for a user based on season and context
     """
     try:
-        recommendations = await agent_orchestrator.get_crop_recommendations(user_id, season)
+        recommendations = await get_agent_orchestrator().get_crop_recommendations(user_id, season)
         return recommendations
         
     except Exception as e:
@@ -174,7 +176,7 @@ async def get_market_insights(
     Get market insights for a specific crop and location
     """
     try:
-        insights = await agent_orchestrator.get_market_insights(crop_name, location)
+        insights = await get_agent_orchestrator().get_market_insights(crop_name, location)
         return insights
         
     except Exception as e:
@@ -187,12 +189,13 @@ async def get_agents_status():
     Get status of all AI agents
     """
     try:
+        orchestrator = get_agent_orchestrator()
         agents_status = {
-            "finance_agent": agent_orchestrator.finance_agent.initialized,
-            "agronomy_agent": agent_orchestrator.agronomy_agent.initialized,
-            "market_agent": agent_orchestrator.market_agent.initialized,
-            "policy_agent": agent_orchestrator.policy_agent.initialized,
-            "risk_agent": agent_orchestrator.risk_agent.initialized
+            "finance_agent": orchestrator.finance_agent.initialized,
+            "agronomy_agent": orchestrator.agronomy_agent.initialized,
+            "market_agent": orchestrator.market_agent.initialized,
+            "policy_agent": orchestrator.policy_agent.initialized,
+            "risk_agent": orchestrator.risk_agent.initialized
         }
         
         return {
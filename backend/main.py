@@ -1,17 +1,18 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 import uvicorn
 import os
 import json
+import orjson
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
 from app.core.database import engine, Base
 from app.api.v1.api import api_router
 from app.core.websocket_manager import WebSocketManager
-from app.agents.agent_orchestrator import AgentOrchestrator
+from app.agents.agent_orchestrator import get_agent_orchestrator
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
@@ -19,16 +20,14 @@ Base.metadata.create_all(bind=engine)
 # WebSocket manager
 websocket_manager = WebSocketManager()
 
-# Agent orchestrator
-agent_orchestrator = AgentOrchestrator()
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting KrishiSampann - Where Crops Meet Capital")
-    await agent_orchestrator.initialize()
+    await get_agent_orchestrator().initialize()
     yield
     # Shutdown
+    await get_agent_orchestrator().shutdown()
     print("🛑 Shutting down KrishiSampann")
 
 app = FastAPI(
@@ -37,7 +36,10 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson encodes large Unicode-heavy responses in C without \uXXXX
+    # expansion of Hindi text
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -71,10 +73,10 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
                 language = "hi"
             
             # Process with KrishiMitra (OpenAI)
-            response = await agent_orchestrator.process_query(query, client_id, language)
+            response = await get_agent_orchestrator().process_query(query, client_id, language)
             
             # Send response back to client
-            await websocket.send_text(json.dumps(response))
+            await websocket.send_text(orjson.dumps(response).decode())
             
     except WebSocketDisconnect:
         websocket_manager.disconnect(client_id)